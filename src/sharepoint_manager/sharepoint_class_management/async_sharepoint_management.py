@@ -0,0 +1,489 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List
+
+from office365.sharepoint.listitems.listitem import ListItem
+
+from sharepoint_manager.sharepoint_class_management.sharepoint_management import (
+    Information,
+    SharepointManagement,
+)
+from sharepoint_manager.sharepoint_functions.functions import (
+    DEFAULT_CHUNK_SIZE,
+    Blob,
+    delete_item_list,
+)
+
+
+class _Pipeline:
+    """
+    Records the calls made on an AsyncSharepointManagement inside
+    AsyncSharepointManagement.pipeline, every call is started at once
+    and its task is returned instead of its result.
+    """
+
+    def __init__(self, manager: "AsyncSharepointManagement") -> None:
+        self._manager = manager
+        self.tasks = []
+
+    def __getattr__(self, method_name: str):
+        method = getattr(self._manager, method_name)
+
+        def _schedule(*args, **kwargs) -> asyncio.Future:
+            task = asyncio.ensure_future(method(*args, **kwargs))
+            self.tasks.append(task)
+            return task
+
+        return _schedule
+
+
+class AsyncSharepointManagement:
+    """Asyncio based sharepoint connection and control class"""
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        url: str,
+        client_id: str,
+        client_secret: str,
+        max_workers: int = 8,
+        cache_ttl: float = 30,
+    ) -> None:
+        """Constructor of the AsyncSharepointManagement class
+
+        The office365 client is blocking, so every operation is executed
+        on a bounded thread pool. Each worker thread uses its own copy of
+        a single SharepointManagement instance, made with
+        SharepointManagement.worker, because a ClientContext keeps a
+        single pending request queue and can not be shared between
+        threads. The copies share the session and the cache of the read
+        operations, so a write made on any worker invalidates the cached
+        results of all of them.
+
+        Args:
+            username (str): Email of the sharepoint user.
+
+            password (str): Outlook mail authentication password.
+
+            url (str): Url of the sharepoint to which you want to make the connection.
+
+            client_id (str): The client ID of the registered Azure AD application.
+
+            client_secret (str): The client secret associated with the application.
+
+            max_workers (int, optional): Maximum number of sharepoint
+            operations executed at the same time. It has a default value
+            of 8.
+
+            cache_ttl (float, optional): Seconds during which the results
+            of the read operations are reused for identical calls. A
+            value of 0 disables the cache. It has a default value of 30.
+        """
+        self.username = username
+        self.password = password
+        self.url = url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.max_workers = max_workers
+        self.cache_ttl = cache_ttl
+        self.list_names = set()
+        self.folder_names = set()
+        self._executor = None
+        self._sharepoint = SharepointManagement(
+            username,
+            password,
+            url,
+            client_id,
+            client_secret,
+            cache_ttl=cache_ttl,
+            io_concurrency=max_workers,
+        )
+        self._owners = {}
+
+    async def __aenter__(self) -> "AsyncSharepointManagement":
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="sp-io"
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Waits for the running sharepoint operations, releases the worker
+        threads and closes the connections of the session.
+        """
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, executor.shutdown, True
+            )
+        self._sharepoint.close()
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[_Pipeline]:
+        """
+        Context in which the sharepoint operations are sent without
+        waiting for the previous ones, the block exits once all of them
+        have finished. Every call returns its task, whose result can be
+        read after the block.
+
+        Example:
+            async with sp.pipeline() as pipe:
+                files = pipe.get_info_files("A")
+                pipe.update_list("Tasks", 1, info)
+            print(files.result())
+
+        Yields:
+            _Pipeline: Object with the same operations of this class.
+        """
+        pipe = _Pipeline(self)
+        try:
+            yield pipe
+        except BaseException:
+            await asyncio.gather(*pipe.tasks, return_exceptions=True)
+            raise
+        await asyncio.gather(*pipe.tasks)
+
+    def _manager(self) -> SharepointManagement:
+        """
+        Returns the SharepointManagement copy of the current worker
+        thread, registering the lists and folders requested through
+        get_conexion_list and get_conexion_folder.
+        """
+        manager = self._sharepoint.worker()
+        if manager.ctx not in self._owners:
+            self._owners[manager.ctx] = (manager, threading.Lock())
+        for list_name in self.list_names - manager.list_conexion.keys():
+            manager.get_conexion_list(list_name)
+        for folder_name in self.folder_names - manager.folder_conexion.keys():
+            manager.get_conexion_folder(folder_name)
+        return manager
+
+    def _call(self, method_name: str, *args, **kwargs):
+        manager = self._manager()
+        with self._owners[manager.ctx][1]:
+            return getattr(manager, method_name)(*args, **kwargs)
+
+    def _delete_item(self, item: ListItem) -> None:
+        """
+        Deletes item with the manager whose client context loaded it,
+        holding its lock so the worker thread that owns the context does
+        not use it at the same time.
+        """
+        owner = self._owners.get(item.context)
+        if owner is None:
+            # The item was not loaded by this instance
+            delete_item_list(item.context, item)
+            self._sharepoint.clear_cache()
+            return
+        manager, lock = owner
+        with lock:
+            manager.delete_item_list(item)
+
+    async def _submit(self, function, *args, **kwargs):
+        """
+        Executes function on the worker thread pool and waits for its
+        result without blocking the event loop.
+        """
+        if self._executor is None:
+            await self.__aenter__()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, lambda: function(*args, **kwargs)
+        )
+
+    async def _run(self, method_name: str, *args, **kwargs):
+        """
+        Executes the SharepointManagement method named method_name with
+        the manager of the worker thread that picks up the call.
+        """
+        return await self._submit(self._call, method_name, *args, **kwargs)
+
+    def get_conexion_list(self, list_name: str) -> None:
+        """
+        Registers the SharePoint list specified by list_name, the
+        connection is resolved by every worker before its next
+        operation.
+
+        Args:
+            list_name (str): Is the name of the SharePoint list to connect to.
+        """
+        self.list_names.add(list_name)
+
+    def get_conexion_folder(self, folder_name: str) -> None:
+        """
+        Registers the SharePoint folder specified by folder_name, the
+        connection is resolved by every worker before its next
+        operation.
+
+        Args:
+            folder_name (str): is the name or identifier of the SharePoint
+            folder to connect to.
+        """
+        self.folder_names.add(folder_name)
+
+    async def get_email_user(self, profesional_id: int) -> str:
+        """
+        Asynchronous version of SharepointManagement.get_email_user.
+
+        Args:
+            professional_id (int): Represents the ID of the professional
+        within SharePoint.
+
+        Returns:
+            str: sharepoint user mail.
+        """
+        return await self._run("get_email_user", profesional_id)
+
+    async def get_info_list(
+        self,
+        list_sharepoint: str,
+        filters: List[Information] = None,
+        select: List[str] = None,
+        expand: List[str] = None,
+        page_size: int = 2000,
+    ):
+        """
+        Asynchronous version of SharepointManagement.get_info_list.
+
+        Args:
+            list_sharepoint (str): Name of the SharePoint list.
+
+            filters (List[Information], optional):  It represents
+            information used for filtering the items in the list.
+
+            select (List[str], optional): Internal names of the columns to
+            retrieve.
+
+            expand (List[str], optional): Lookup or person columns whose
+            values are retrieved with the items.
+
+            page_size (int, optional): Number of items requested in every
+            page.
+
+        Returns:
+            ListItem: The function returns either the filtered items
+            list or the original items collection, depending on the
+            presence of filters.
+        """
+        return await self._run(
+            "get_info_list", list_sharepoint, filters, select, expand, page_size
+        )
+
+    async def get_folder_contents(self, folder_name: str):
+        """
+        Asynchronous version of SharepointManagement.get_folder_contents.
+
+        Args:
+            folder_name (str): Name of the folder name.
+
+        Returns:
+            The folders and the files collections of the folder.
+        """
+        return await self._run("get_folder_contents", folder_name)
+
+    async def get_info_folders(
+        self, folder_name: str, select: List[str] = None, expand: List[str] = None
+    ):
+        """
+        Asynchronous version of SharepointManagement.get_info_folders.
+
+        Args:
+            folder_name (str): Name of the folder name.
+
+            select (List[str], optional): Properties of the folders to
+            retrieve.
+
+            expand (List[str], optional): Related objects of the folders
+            retrieved with them.
+
+        Returns:
+            The function then returns the retrieved folders collection.
+        """
+        return await self._run("get_info_folders", folder_name, select, expand)
+
+    async def get_info_files(
+        self, folder_name: str, select: List[str] = None, expand: List[str] = None
+    ):
+        """
+        Asynchronous version of SharepointManagement.get_info_files.
+
+        Args:
+            folder_name (str): Name of the folder name.
+
+            select (List[str], optional): Properties of the files to
+            retrieve.
+
+            expand (List[str], optional): Related objects of the files
+            retrieved with them.
+
+        Returns:
+            The function will return a collection of SharePoint files.
+        """
+        return await self._run("get_info_files", folder_name, select, expand)
+
+    async def update_list(
+        self, list_name: str, id_item: int, update_info: List[Information]
+    ) -> None:
+        """
+        Asynchronous version of SharepointManagement.update_list.
+
+        Args:
+            list_name (str): Name of the sharepoint list.
+
+            id_item (int): Represents the ID of the item in the SharePoint
+            list that needs to be updated.
+
+            update_info (List[Information]): Represents the list of
+            information to update on the SharePoint item.
+        """
+        await self._run("update_list", list_name, id_item, update_info)
+
+    async def bulk_update(
+        self, list_name: str, filters, update_info: List[Information]
+    ) -> int:
+        """
+        Asynchronous version of SharepointManagement.bulk_update.
+
+        Args:
+            list_name (str): Name of the sharepoint list.
+
+            filters: OData $filter expression or column and value pairs
+            that the items to update must match.
+
+            update_info (List[Information]): Represents the list of
+            information to update on the items.
+
+        Returns:
+            int: Number of updated items.
+        """
+        return await self._run("bulk_update", list_name, filters, update_info)
+
+    async def add_new_item(
+        self,
+        list_name: str,
+        information: dict,
+        attachment: Blob = None,
+        attachment_name: str = None,
+    ) -> None:
+        """
+        Asynchronous version of SharepointManagement.add_new_item.
+
+        Args:
+            list_name (str): Name of the sharepoint list.
+
+            information (dict): Represents the information to be included
+            in the new item.
+
+            attachment (Blob, optional): Optional attachment to be
+            associated with the new item. It can be a file path, bytes or
+            a binary stream. It has a default value of None.
+
+            attachment_name (str, optional): Name of the attachment,
+            required when attachment is not a file path.
+        """
+        await self._run(
+            "add_new_item", list_name, information, attachment, attachment_name
+        )
+
+    async def create_folder(self, relative_path: str, folder_name: str) -> None:
+        """
+        Asynchronous version of SharepointManagement.create_folder.
+
+        Args:
+            relative_path (str): Relative path where the new folder will
+            be created.
+
+            folder_name (str): Name of the new folder to be created.
+        """
+        await self._run("create_folder", relative_path, folder_name)
+
+    async def is_sharepoint_folder(self, relative_path: str, folder_name: str) -> bool:
+        """
+        Asynchronous version of SharepointManagement.is_sharepoint_folder.
+
+        Args:
+            relative_path (str): Relative path of the parent folder.
+
+            folder_name (str): Name of the folder to look for.
+
+        Returns:
+            bool: True if the folder exists, otherwise return false.
+        """
+        return await self._run("is_sharepoint_folder", relative_path, folder_name)
+
+    async def upload_file_sharepoint(
+        self,
+        relative_path: str,
+        file_upload: Blob,
+        file_name: str = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_uploaded: Callable[[int], None] = None,
+    ) -> None:
+        """
+        Asynchronous version of SharepointManagement.upload_file_sharepoint.
+
+        Args:
+            relative_path (str): Relative path of the target folder where
+            the file will be uploaded.
+
+            file_upload (Blob): The file to be uploaded. It can be a file
+            path (str), bytes or a binary stream such as a BytesIO object.
+
+            file_name (str, optional): Desired name of the file in
+            SharePoint, required when file_upload is not a file path. It
+            has a default value of None.
+
+            chunk_size (int, optional): Size in bytes of every chunk when
+            the file is bigger than 10 MiB and is uploaded in chunks. It
+            has a default value of 4 MiB.
+
+            chunk_uploaded (Callable[[int], None], optional): Function
+            called with the number of bytes uploaded so far, to report
+            the progress of the upload. It is called from the worker
+            thread, not from the event loop.
+        """
+        await self._run(
+            "upload_file_sharepoint",
+            relative_path,
+            file_upload,
+            file_name,
+            chunk_size,
+            chunk_uploaded,
+        )
+
+    async def create_list(self, list_name: str) -> None:
+        """
+        Asynchronous version of SharepointManagement.create_list.
+
+        Args:
+            list_name (str): Name of the sharepoint list.
+        """
+        await self._run("create_list", list_name)
+
+    async def delete_item_list(self, item: ListItem) -> None:
+        """
+        Asynchronous version of SharepointManagement.delete_item_list.
+        The deletion is executed by the manager of the worker whose
+        client context loaded the item, and the cached results of the
+        lists are invalidated.
+
+        Args:
+            item (ListItem): Item to be deleted.
+        """
+        await self._submit(self._delete_item, item)
+
+    async def delete_folder_with_contents(self, relative_path: str, folder_name: str) -> None:
+        """
+        Asynchronous version of SharepointManagement.delete_folder_with_contents.
+
+        Args:
+            relative_path (str): Server-relative path of the parent folder.
+            folder_name (str): Name of the folder to delete.
+        """
+        await self._run("delete_folder_with_contents", relative_path, folder_name)
@@ -1,6 +1,10 @@
-import io
+import copy
 import os
-from typing import List, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
 from office365.runtime.auth.authentication_context import AuthenticationContext
 from office365.sharepoint.attachments.attachmentfile_creation_information import (
@@ -13,49 +17,67 @@ from office365.sharepoint.listitems.listitem import ListItem
 from office365.sharepoint.lists.list import List as ListSharepoint
 from office365.sharepoint.lists.list_creation_information import ListCreationInformation
 from office365.sharepoint.lists.list_template_type import ListTemplateType
-from pydantic import BaseModel
 
 from sharepoint_manager.sharepoint_functions.functions import (
+    DEFAULT_CHUNK_SIZE,
+    Blob,
+    Information,
+    InformationModel,
     add_new_item,
+    bulk_update,
+    clear_context_cache,
+    clone_context,
     create_folder,
     create_list,
     get_connection_folder,
     get_connection_list,
+    create_session,
     get_connection_sharepoint,
     get_connection_sharepoint_token,
     get_email_user,
+    get_users_emails,
     get_info_list,
     is_sharepoint_folder,
     update_list,
     upload_file_sharepoint,
-    get_info_folders,
+    get_folder_contents,
     get_info_files,
+    get_info_folders,
     delete_item_list,
     delete_folder_with_contents,
+    to_information,
+    join_rel,
 )
 
 
-class Information(BaseModel):
-    """
-    Defines a class called "Information" which is a subclass of
-    "BaseModel". The "Information" class is used to load information
-    into a specific column.
+class _LazyDict(dict):
+    """Dictionary that builds the missing values with factory(key)."""
 
-    Args:
-        column (str): Name of the column to which the information will
-        be loaded.
+    def __init__(self, factory: Callable[[Any], Any]) -> None:
+        super().__init__()
+        self._factory = factory
 
-        value (str): Data to be loaded to the column.
-    """
-
-    column: str
-    value: str
+    def __missing__(self, key):
+        value = self[key] = self._factory(key)
+        return value
 
 
 class SharepointManagement:
     """Sharepoint connection and control class"""
 
-    def __init__(self, username: str, password: str, url: str, client_id:str, client_secret:str) -> None:
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        url: str,
+        client_id: str,
+        client_secret: str,
+        cache_ttl: float = 30,
+        compress: bool = True,
+        io_concurrency: int = None,
+        max_retries: int = 6,
+        backoff: float = 0.5,
+    ) -> None:
         """Constructor of the SharepointConnection class
     
         Args:
@@ -64,16 +86,91 @@ class SharepointManagement:
             password (str): Outlook mail authentication password.
     
             url (str): Url of the sharepoint to which you want to make the connection.
+
+            cache_ttl (float, optional): Seconds during which the results
+            of the read wrappers are reused for identical calls. A value
+            of 0 disables the cache. It has a default value of 30.
+
+            compress (bool, optional): If True the responses of SharePoint
+            are requested compressed with gzip. It has a default value of
+            True.
+
+            io_concurrency (int, optional): Maximum number of requests in
+            flight at the same time. It sizes both the thread pool used by
+            map and the connection pool of the session, so neither waits
+            for the other. It defaults to four times the number of CPUs,
+            up to 32.
+
+            max_retries (int, optional): Number of times a request that
+            is throttled by SharePoint (429 or 503) or fails transiently
+            is retried, waiting what the Retry-After header asks for. It
+            has a default value of 6.
+
+            backoff (float, optional): Factor of the exponential, jittered
+            wait between retries when SharePoint does not send a
+            Retry-After header. It has a default value of 0.5.
         """
         self.username = username
         self.password = password
         self.client_id = client_id
         self.client_secret = client_secret
         self.url = url
-        self.ctx = None
-        self.list_conexion = {}
-        self.folder_conexion = {}
-        self.get_conexion_sharepoint()
+        self.io_concurrency = io_concurrency or min(32, (os.cpu_count() or 1) * 4)
+        self.session = create_session(
+            pool_maxsize=self.io_concurrency,
+            max_retries=max_retries,
+            backoff_factor=backoff,
+            compress=compress,
+        )
+        self._ctx = None
+        self.list_conexion = _LazyDict(self._resolve_list)
+        self.folder_conexion = _LazyDict(self._resolve_folder)
+        self.defer_queries = False
+        self.cache_ttl = cache_ttl
+        self._read_cache = {}
+        self._cache_lock = threading.Lock()
+        # Shared with the copies made by worker, like _read_cache
+        self._user_cache = {}
+        self._user_lock = threading.Lock()
+        self._worker_contexts = []
+        self._executor = None
+        self._local = threading.local()
+
+    def __enter__(self) -> "SharepointManagement":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        The close method waits for the calls running on the thread pool,
+        releases its threads and closes the connections of the session.
+        """
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=True)
+        self.session.close()
+
+    @property
+    def ctx(self) -> ClientContext:
+        """
+        SharePoint client context, the connection is established on
+        first use.
+        """
+        if self._ctx is None:
+            self.get_conexion_sharepoint()
+        return self._ctx
+
+    @ctx.setter
+    def ctx(self, value: ClientContext) -> None:
+        self._ctx = value
+
+    def _resolve_list(self, list_name: str) -> ListSharepoint:
+        return get_connection_list(self.ctx, list_name)
+
+    def _resolve_folder(self, folder_name: str) -> ListSharepoint:
+        return get_connection_folder(self.ctx, folder_name)
 
     def get_conexion_sharepoint(self) -> None:
         """
@@ -82,9 +179,12 @@ class SharepointManagement:
         get_connection_sharepoint_token function with the necessary parameters
         (self.url, self.client_id, self.client_secret). The connection object
         returned by the function is then assigned to the ctx attribute
-        of the class instance.
+        of the class instance. Every request of the context reuses the
+        connections of self.session.
         """
-        self.ctx = get_connection_sharepoint_token(self.url, self.client_id, self.client_secret)
+        self.ctx = get_connection_sharepoint_token(
+            self.url, self.client_id, self.client_secret, self.session
+        )
 
     def get_conexion_list(self, list_name) -> None:
         """
@@ -94,11 +194,28 @@ class SharepointManagement:
         context (self.ctx) and the list name as arguments. The result
         of the function call is then stored in the list_conexion
         attribute of the class instance, with list_name as the key.
+        If the list is already connected the stored connection is kept,
+        use invalidate_list to resolve it again.
 
         Args:
             list_name: Is the name of the SharePoint list to connect to.
         """
-        self.list_conexion[list_name] = get_connection_list(self.ctx, list_name)
+        if list_name in self.list_conexion:
+            return
+        self.list_conexion[list_name] = self._resolve_list(list_name)
+
+    def invalidate_list(self, list_name) -> None:
+        """
+        Removes the stored connection of the SharePoint list specified
+        by list_name and the field types loaded for it, so the next
+        operation resolves them again.
+
+        Args:
+            list_name: Is the name of the SharePoint list.
+        """
+        self.list_conexion.pop(list_name, None)
+        if self._ctx is not None:
+            clear_context_cache(self._ctx, "lists", list_name)
 
     def get_conexion_folder(self, folder_name) -> None:
         """
@@ -108,22 +225,216 @@ class SharepointManagement:
         client context (self.ctx) and the folder name as arguments.
         The result of the function call is then stored in the
         folder_conexion attribute of the class instance, with
-        folder_name as the key.
+        folder_name as the key. If the folder is already connected the
+        stored connection is kept, use invalidate_folder to resolve it
+        again.
 
         Args:
             folder_name: is the name or identifier of the SharePoint
             folder to connect to.
         """
-        self.folder_conexion[folder_name] = get_connection_folder(self.ctx, folder_name)
+        if folder_name in self.folder_conexion:
+            return
+        self.folder_conexion[folder_name] = self._resolve_folder(folder_name)
+
+    def invalidate_folder(self, folder_name) -> None:
+        """
+        Removes the stored connection of the SharePoint folder specified
+        by folder_name, so the next operation resolves it again.
+
+        Args:
+            folder_name: is the name or identifier of the SharePoint
+            folder.
+        """
+        self.folder_conexion.pop(folder_name, None)
+        if self._ctx is not None:
+            clear_context_cache(self._ctx, "folders", folder_name)
+
+    @contextmanager
+    def begin_batch(self) -> Iterator["SharepointManagement"]:
+        """
+        The begin_batch method returns a context manager inside of which
+        get_info_list, get_info_folders and get_info_files only queue
+        their queries in the client context and return the collections
+        still empty. The queued queries are sent to SharePoint in a
+        single $batch request with commit_batch, which fills the
+        collections.
+
+        Example:
+            with sp.begin_batch():
+                files_a = sp.get_info_files("A")
+                files_b = sp.get_info_files("B")
+            sp.commit_batch()
+        """
+        self.defer_queries = True
+        try:
+            yield self
+        finally:
+            self.defer_queries = False
+
+    def commit_batch(self) -> None:
+        """
+        The commit_batch method sends every query queued in the client
+        context as a single SharePoint $batch request.
+
+        Raises:
+            SharepointBatchErrors: If some of the queued queries failed,
+            the others were executed.
+        """
+        self.ctx.execute_batch()
+
+    def _cached(self, key: tuple, function: Callable[[], Any], ttl: float = None) -> Any:
+        """
+        Returns the result stored for key if it is younger than ttl
+        seconds, otherwise calls function and stores its result. Queries
+        deferred with begin_batch are never cached. The cache is shared
+        with the copies made by worker, so it is guarded by a lock.
+
+        Args:
+            key (tuple): Identifier of the call, its first element is the
+            name of the operation.
+
+            function (Callable[[], Any]): Call that produces the result.
+
+            ttl (float, optional): Lifetime of the result, self.cache_ttl
+            is used when it is not provided.
+        """
+        ttl = self.cache_ttl if ttl is None else ttl
+        if ttl <= 0 or self.defer_queries:
+            return function()
+        with self._cache_lock:
+            cached = self._read_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        result = function()
+        with self._cache_lock:
+            self._read_cache[key] = (time.monotonic(), result)
+        return result
+
+    def _invalidate_prefix(self, *prefix) -> None:
+        """
+        Removes the cached results whose key starts with prefix.
+        """
+        with self._cache_lock:
+            for key in list(self._read_cache):
+                if key[: len(prefix)] == prefix:
+                    del self._read_cache[key]
+
+    def clear_cache(self) -> None:
+        """
+        Removes every cached result of the read wrappers.
+        """
+        with self._cache_lock:
+            self._read_cache.clear()
+
+    def worker(self) -> "SharepointManagement":
+        """
+        Returns a copy of the instance bound to a client context of its
+        own for the current thread. A ClientContext keeps a single
+        pending query queue, so it can not be shared between threads,
+        while the authentication, the session, the loaded site users and
+        the cache of the read wrappers are shared, so a write made by any
+        copy invalidates the results cached by all of them.
+        """
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = copy.copy(self)
+            worker.ctx = clone_context(self.ctx)
+            worker.list_conexion = _LazyDict(worker._resolve_list)
+            worker.folder_conexion = _LazyDict(worker._resolve_folder)
+            worker.defer_queries = False
+            # The copies send their parallel requests on the pool of the
+            # instance instead of creating one of their own.
+            worker._pool = self._pool
+            self._worker_contexts.append(worker.ctx)
+            self._local.worker = worker
+        return worker
+
+    def map(
+        self, method_name: str, items: Iterable[Any], max_concurrency: int = None
+    ) -> List[Any]:
+        """
+        The map method calls the wrapper named method_name once for
+        every element of items, running up to max_concurrency calls at
+        the same time on a thread pool kept for the lifetime of the
+        instance. Each thread uses its own client context. Tuple
+        elements are unpacked as positional arguments.
+
+        Example:
+            files_a, files_b = sp.map("get_info_files", ["A", "B"])
+
+        Args:
+            method_name (str): Name of the SharepointManagement method
+            to call.
+
+            items (Iterable[Any]): Arguments of each call.
+
+            max_concurrency (int, optional): Maximum number of calls
+            running at the same time, it can not exceed io_concurrency,
+            which is used when it is not provided. Too many connections
+            can trigger the SharePoint throttling, so it should be tuned
+            for each tenant.
+
+        Returns:
+            List[Any]: Results of the calls, in the order of items.
+        """
+        semaphore = threading.BoundedSemaphore(max_concurrency or self.io_concurrency)
+
+        def _call(arguments):
+            with semaphore:
+                if not isinstance(arguments, tuple):
+                    arguments = (arguments,)
+                self._local.in_pool = True
+                return getattr(self.worker(), method_name)(*arguments)
+
+        return list(self._pool().map(_call, items))
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool kept for the lifetime of the instance,
+        of io_concurrency threads, creating it on first use.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.io_concurrency, thread_name_prefix="sp-io"
+            )
+        return self._executor
+
+    def _ensure_user_cache(self) -> Dict[int, str]:
+        """
+        Returns the email of every site user by user ID, loading them
+        all with a single request the first time it is called. The
+        users are shared with the copies made by worker and the lock
+        makes the threads that need them at the same time wait for that
+        single request.
+        """
+        with self._user_lock:
+            emails = self._user_cache.get("emails")
+            if emails is None:
+                emails = self._user_cache["emails"] = get_users_emails(self.ctx)
+        return emails
+
+    def refresh_users(self) -> None:
+        """
+        Discards the loaded site users, so the next call to
+        get_email_user loads them again, in this instance and in the
+        copies made by worker.
+        """
+        with self._user_lock:
+            self._user_cache.clear()
+        contexts = list(self._worker_contexts)
+        if self._ctx is not None:
+            contexts.append(self._ctx)
+        for ctx in contexts:
+            clear_context_cache(ctx, "emails")
 
     def get_email_user(self, profesional_id: int) -> str:
         """
-        the get_email_user method is method is a wrapper that delegates
-        the task of retrieving the email of a SharePoint user to another
-        function or method named get_email_user. The SharePoint client
-        context (self.ctx) and the professional ID are passed as
-        arguments to this function. The method simply returns the
-        result obtained from calling the get_email_user function.
+        the get_email_user method returns the email of a SharePoint
+        user. Every site user is loaded once with get_users_emails and
+        kept in memory, so resolving many users costs a single request.
+        Only a user missing from the loaded ones is looked up with the
+        get_email_user function.
 
         Args:
             professional_id (int): Represents the ID of the professional
@@ -132,12 +443,18 @@ class SharepointManagement:
         Returns:
             str: sharepoint user mail.
         """
-        return get_email_user(self.ctx, profesional_id)
+        email = self._ensure_user_cache().get(profesional_id)
+        if email is None:
+            email = get_email_user(self.ctx, profesional_id)
+        return email
 
     def get_info_list(
         self,
         list_sharepoint: str,
-        filters: List[Information] = None,
+        filters: List[Union[Information, InformationModel]] = None,
+        select: List[str] = None,
+        expand: List[str] = None,
+        page_size: int = 2000,
     ) -> dict:
         """
         The get_info_list method is a wrapper that delegates the task of
@@ -152,59 +469,164 @@ class SharepointManagement:
         Args:
             list_sharepoint (str): Name of the SharePoint list.
 
-            filters (List[Information], optional):  It represents
-            information used for filtering the items in the list.
+            filters (List[Union[Information, InformationModel]], optional):
+            It represents information used for filtering the items in the
+            list.
+
+            select (List[str], optional): Internal names of the columns to
+            retrieve. All the columns are retrieved when it is not
+            provided.
+
+            expand (List[str], optional): Lookup or person columns whose
+            values are retrieved with the items.
+
+            page_size (int, optional): Number of items requested in every
+            page, all the pages are loaded. It has a default value of
+            2000.
 
         Returns:
             ListItem: The function returns either the filtered items
             list or the original items collection, depending on the
             presence of filters.
         """
-        return get_info_list(
-            self.ctx,
-            self.list_conexion[list_sharepoint],
-            filters,
+        self.get_conexion_list(list_sharepoint)
+        if filters is not None:
+            filters = to_information(filters)
+        key = (
+            "info_list",
+            list_sharepoint,
+            frozenset(filters or ()),
+            tuple(select) if select is not None else None,
+            tuple(expand or ()),
+        )
+        return self._cached(
+            key,
+            lambda: get_info_list(
+                self.ctx,
+                self.list_conexion[list_sharepoint],
+                filters,
+                self.defer_queries,
+                select,
+                expand,
+                page_size,
+            ),
         )
 
-    def get_info_folders(self, folder_name: str):
+    def get_folder_contents(
+        self, folder_name: str
+    ) -> Tuple[FolderCollection, FileCollection]:
         """
-        The get_info_folders method is a wrapper that delegates the task
-        of obtaining information about folders in SharePoint to another
-        function or method named get_info_folders. The SharePoint client
-        context (self.ctx) and the connection to the folder
-        (self.folder_conexion[folder_name]) are passed as arguments to
-        this function. The method simply returns the result obtained
-        from calling the get_info_folders function.
+        The get_folder_contents method is a wrapper that delegates the
+        task of obtaining the subfolders and the files of a SharePoint
+        folder to the get_folder_contents function, which fetches both
+        with a single request. The result is cached, so get_info_folders
+        and get_info_files called for the same folder share it.
 
         Args:
             folder_name (str): Name of the folder name.
 
+        Returns:
+            Tuple[FolderCollection, FileCollection]: The folders and the
+            files collections of the folder.
+        """
+        self.get_conexion_folder(folder_name)
+        return self._cached(
+            ("folder_contents", folder_name),
+            lambda: get_folder_contents(
+                self.ctx, self.folder_conexion[folder_name], self.defer_queries
+            ),
+        )
+
+    def get_info_folders(
+        self, folder_name: str, select: List[str] = None, expand: List[str] = None
+    ):
+        """
+        The get_info_folders method returns the folders collection of
+        the SharePoint folder (self.folder_conexion[folder_name]). It is
+        obtained through get_folder_contents, so a following call to
+        get_info_files for the same folder does not send a new request.
+
+        Args:
+            folder_name (str): Name of the folder name.
+
+            select (List[str], optional): Properties of the folders to
+            retrieve. When select or expand are provided the folders are
+            requested on their own, with only those properties.
+
+            expand (List[str], optional): Related objects of the folders
+            retrieved with them.
+
         Returns:
             The function then returns the retrieved folders collection.
         """
 
-        return get_info_folders(self.ctx, self.folder_conexion[folder_name])
+        if select is None and not expand:
+            return self.get_folder_contents(folder_name)[0]
+        self.get_conexion_folder(folder_name)
+        return self._cached(
+            (
+                "folder_contents",
+                folder_name,
+                "folders",
+                tuple(select) if select is not None else None,
+                tuple(expand or ()),
+            ),
+            lambda: get_info_folders(
+                self.ctx,
+                self.folder_conexion[folder_name],
+                self.defer_queries,
+                select,
+                expand,
+            ),
+        )
 
-    def get_info_files(self, folder_name: str):
+    def get_info_files(
+        self, folder_name: str, select: List[str] = None, expand: List[str] = None
+    ):
         """
-        The get_info_files method is a wrapper that delegates the task
-        of obtaining information about files in a SharePoint folder to
-        another function or method named get_info_files. The SharePoint
-        client context (self.ctx) and the connection to the folder
-        (self.folder_conexion[folder_name]) are passed as arguments to
-        this function. The method simply returns the result obtained
-        from calling the get_info_files function.
+        The get_info_files method returns the files collection of the
+        SharePoint folder (self.folder_conexion[folder_name]). It is
+        obtained through get_folder_contents, so a following call to
+        get_info_folders for the same folder does not send a new request.
 
         Args:
             folder_name (str): Name of the folder name.
 
+            select (List[str], optional): Properties of the files to
+            retrieve. When select or expand are provided the files are
+            requested on their own, with only those properties.
+
+            expand (List[str], optional): Related objects of the files
+            retrieved with them.
+
         Returns:
             The function will return a collection of SharePoint files.
         """
-        return get_info_files(self.ctx, self.folder_conexion[folder_name])
+        if select is None and not expand:
+            return self.get_folder_contents(folder_name)[1]
+        self.get_conexion_folder(folder_name)
+        return self._cached(
+            (
+                "folder_contents",
+                folder_name,
+                "files",
+                tuple(select) if select is not None else None,
+                tuple(expand or ()),
+            ),
+            lambda: get_info_files(
+                self.ctx,
+                self.folder_conexion[folder_name],
+                self.defer_queries,
+                select,
+                expand,
+            ),
+        )
 
     def update_list(
-        self, list_name: str, id_item: int, update_info: List[Information]
+        self,
+        list_name: str,
+        id_item: int,
+        update_info: List[Union[Information, InformationModel]],
     ) -> None:
         """
         The update_list method is a wrapper that delegates the task of
@@ -220,18 +642,63 @@ class SharepointManagement:
             id_item (int): Represents the ID of the item in the SharePoint
             list that needs to be updated.
 
-            update_info (List[Information]): Represents the list of
-            information to update on the SharePoint item.
+            update_info (List[Union[Information, InformationModel]]):
+            Represents the list of information to update on the
+            SharePoint item.
         """
+        self.get_conexion_list(list_name)
         update_list(
             self.ctx,
             self.list_conexion[list_name],
             id_item,
-            update_info,
+            to_information(update_info),
         )
+        self._invalidate_prefix("info_list", list_name)
+
+    def bulk_update(
+        self,
+        list_name: str,
+        filters: Union[str, List[Union[Information, InformationModel]]],
+        update_info: List[Union[Information, InformationModel]],
+    ) -> int:
+        """
+        The bulk_update method is a wrapper that delegates the task of
+        updating every item of a SharePoint list that matches filters to
+        the bulk_update function, which sends all the updates together.
+
+        Args:
+            list_name (str): Name of the sharepoint list.
+
+            filters (Union[str, List[Union[Information, InformationModel]]]):
+            OData $filter expression or column and value pairs that the
+            items to update must match.
+
+            update_info (List[Union[Information, InformationModel]]):
+            Represents the list of information to update on the items.
+
+        Returns:
+            int: Number of updated items.
+        """
+        self.get_conexion_list(list_name)
+        if not isinstance(filters, str):
+            filters = to_information(filters)
+        try:
+            return bulk_update(
+                self.ctx,
+                self.list_conexion[list_name],
+                filters,
+                to_information(update_info),
+            )
+        finally:
+            # Some items may have been updated even if others failed
+            self._invalidate_prefix("info_list", list_name)
 
     def add_new_item(
-        self, list_name: str, information: dict, attachment: str = None
+        self,
+        list_name: str,
+        information: dict,
+        attachment: Blob = None,
+        attachment_name: str = None,
     ) -> None:
         """
 
@@ -240,7 +707,7 @@ class SharepointManagement:
         add_new_item. The SharePoint client context (self.ctx), the
         connection to the list (self.list_conexion[list_name]), the
         information of the new item (information), and the attachment
-        file path (attachment) are passed as arguments to this function.
+        (attachment) are passed as arguments to this function.
 
         Args:
             list_name (str): Name of the sharepoint list.
@@ -250,11 +717,22 @@ class SharepointManagement:
             keys represent the column names and the values represent the
             column values.
 
-            attachment (str, optional): Path to an optional attachment file
-            to be associated with the new item. It has a default value of
-            None.
+            attachment (Blob, optional): Optional attachment to be
+            associated with the new item. It can be a file path, bytes or
+            a binary stream. It has a default value of None.
+
+            attachment_name (str, optional): Name of the attachment,
+            required when attachment is not a file path.
         """
-        add_new_item(self.ctx, self.list_conexion[list_name], information, attachment)
+        self.get_conexion_list(list_name)
+        add_new_item(
+            self.ctx,
+            self.list_conexion[list_name],
+            information,
+            attachment,
+            attachment_name,
+        )
+        self._invalidate_prefix("info_list", list_name)
 
     def create_folder(self, relative_path: str, folder_name: str) -> None:
         """
@@ -271,6 +749,8 @@ class SharepointManagement:
             folder_name (str): Name of the new folder to be created.
         """
         create_folder(self.ctx, relative_path, folder_name)
+        self._invalidate_prefix("folder_contents")
+        self._invalidate_prefix("is_folder")
 
     def is_sharepoint_folder(self, relative_path: str, folder_name: str) -> bool:
         """
@@ -291,13 +771,18 @@ class SharepointManagement:
         Returns:
             bool: True if the folder exists, otherwise return false.
         """
-        return is_sharepoint_folder(self.ctx, relative_path, folder_name)
+        return self._cached(
+            ("is_folder", relative_path, folder_name),
+            lambda: is_sharepoint_folder(self.ctx, relative_path, folder_name),
+        )
 
     def upload_file_sharepoint(
         self,
         relative_path: str,
-        file_upload: Union[str, io.BytesIO],
+        file_upload: Blob,
         file_name: str = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_uploaded: Callable[[int], None] = None,
     ) -> None:
         """
         The upload_file_sharepoint method is a wrapper that delegates
@@ -312,13 +797,25 @@ class SharepointManagement:
             relative_path (str): Relative path of the target folder where
             the file will be uploaded.
 
-            file_upload (Union[str, io.BytesIO]): The file to be uploaded.
-            It can be either a file path (str) or a BytesIO object.
+            file_upload (Blob): The file to be uploaded. It can be a file
+            path (str), bytes or a binary stream such as a BytesIO object.
 
             file_name (str, optional): Desired name of the file in
-            SharePoint. It has a default value of None.
+            SharePoint, required when file_upload is not a file path. It
+            has a default value of None.
+
+            chunk_size (int, optional): Size in bytes of every chunk when
+            the file is bigger than 10 MiB and is uploaded in chunks. It
+            has a default value of 4 MiB.
+
+            chunk_uploaded (Callable[[int], None], optional): Function
+            called with the number of bytes uploaded so far, to report
+            the progress of the upload.
         """
-        upload_file_sharepoint(self.ctx, relative_path, file_upload, file_name)
+        upload_file_sharepoint(
+            self.ctx, relative_path, file_upload, file_name, chunk_size, chunk_uploaded
+        )
+        self._invalidate_prefix("folder_contents")
 
     def create_list(self, list_name: str) -> None:
         """
@@ -341,15 +838,35 @@ class SharepointManagement:
             item (ListItem): Item to be deleted.
         """
         delete_item_list(self.ctx, item)
+        self._invalidate_prefix("info_list")
 
 
     def delete_folder_with_contents(self, relative_path: str, folder_name: str) -> None:
         """
-        Delete a SharePoint folder and its contents recursively.
+        Delete a SharePoint folder and its contents recursively. The
+        $batch requests are sent at the same time on the thread pool of
+        the instance, or one after the other when the call is already
+        running on it, from map.
 
         Args:
             relative_path (str): Server-relative path of the parent folder.
             folder_name (str): Name of the folder to delete.
+
+        Raises:
+            ClientRequestException: If the folder itself could not be
+            read or deleted.
+            SharepointBatchErrors: If a file or a subfolder could not be
+            read or deleted. The rest of the tree may already have been
+            deleted.
         """
-        full_path = f"{relative_path}/{folder_name}"
-        delete_folder_with_contents(self.ctx, full_path)
+        full_path = join_rel(relative_path, folder_name)
+        try:
+            if getattr(self._local, "in_pool", False):
+                delete_folder_with_contents(self.ctx, full_path, max_workers=1)
+            else:
+                delete_folder_with_contents(
+                    self.ctx, full_path, self.io_concurrency, self._pool()
+                )
+        finally:
+            self._invalidate_prefix("folder_contents")
+            self._invalidate_prefix("is_folder")
@@ -1,8 +1,47 @@
+import inspect
 import io
+import mmap
+import ntpath
 import os
-from typing import List, Union
-from office365.runtime.auth.client_credential import ClientCredential
+import posixpath
+import re
+import threading
+import time
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from office365.runtime.auth.authentication_context import AuthenticationContext
+from office365.runtime.auth.providers.acs_token_provider import ACSTokenProvider
+from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.client_request import ClientRequest
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.compat import message_from_bytes_or_string
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.odata.odata_request import ODataRequest
+from office365.runtime.odata.v3.batch_request import ODataBatchRequest
+from office365.runtime.odata.v3.json_light_format import JsonLightFormat
+from office365.runtime.queries.batch_query import BatchQuery
+from office365.runtime.queries.client_query import ClientQuery
 from office365.sharepoint.attachments.attachmentfile_collection import (
     AttachmentFileCollection,
 )
@@ -10,7 +49,10 @@ from office365.sharepoint.attachments.attachmentfile_creation_information import
     AttachmentfileCreationInformation,
 )
 from office365.sharepoint.client_context import ClientContext
+from office365.sharepoint.files.file import File
 from office365.sharepoint.files.file_collection import FileCollection
+from office365.sharepoint.files.file_creation_information import FileCreationInformation
+from office365.sharepoint.folders.folder import Folder
 from office365.sharepoint.folders.folder_collection import FolderCollection
 from office365.sharepoint.listitems.listitem import ListItem
 from office365.sharepoint.lists.list import List as ListSharepoint
@@ -18,12 +60,44 @@ from office365.sharepoint.lists.list_creation_information import ListCreationInf
 from office365.sharepoint.lists.list_template_type import ListTemplateType
 from pydantic import BaseModel
 
+USER_AGENT = "sharepoint-manager"
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+THROTTLE_STATUSES = frozenset([429, 503])
+# SharePoint sends MERGE and DELETE as POST with an X-HTTP-Method header,
+# so they are retried as POST requests, see SharepointRetry.
+RETRY_METHODS = frozenset(["GET", "MERGE", "DELETE", "PATCH", "PUT"])
+CHUNKED_UPLOAD_THRESHOLD = 10 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+ODATA_TEXT_FIELDS = {"Text", "Choice"}
+ODATA_NUMBER_FIELDS = {"Counter", "Integer", "Number", "Currency"}
+ODATA_NUMBER_PATTERN = re.compile(r"-?\d+(\.\d+)?")
+# Fields that SharePoint filters through an index even if Indexed is False
+ODATA_ALWAYS_INDEXED_FIELDS = {"Counter"}
+
+
+class Information(NamedTuple):
+    """
+    Defines a class called "Information" which is a named tuple. The
+    "Information" class is used to load information into a specific
+    column. Being a tuple it is cheap to build and hashable.
+
+    Args:
+        column (str): Name of the column to which the information will
+        be loaded.
 
-class Information(BaseModel):
+        value (str): Data to be loaded to the column.
     """
-    Defines a class called "Information" which is a subclass of
-    "BaseModel". The "Information" class is used to load information
-    into a specific column.
+
+    column: str
+    value: str
+
+
+class InformationModel(BaseModel):
+    """
+    Defines a class called "InformationModel" which is a subclass of
+    "BaseModel". It has the same fields as "Information" and is meant
+    to validate column and value pairs received from external sources
+    before converting them with to_information.
 
     Args:
         column (str): Name of the column to which the information will
@@ -36,6 +110,26 @@ class Information(BaseModel):
     value: str
 
 
+def to_information(
+    items: List[Union[Information, InformationModel]]
+) -> List[Information]:
+    """
+    Converts a list of InformationModel, or of Information, into a list
+    of Information.
+
+    Args:
+        items (List[Union[Information, InformationModel]]): Column and
+        value pairs.
+
+    Returns:
+        List[Information]: The same pairs as Information tuples.
+    """
+    return [
+        item if isinstance(item, Information) else Information(item.column, item.value)
+        for item in items
+    ]
+
+
 class SharepointErrors(Exception):
     """
     Defines a custom exception class called "SharepointErrors" that
@@ -49,10 +143,387 @@ class SharepointErrors(Exception):
         super().__init__(self.message)
 
 
-def get_connection_sharepoint(url: str, username: str, password: str) -> ClientContext:
+class SharepointBatchErrors(SharepointErrors):
+    """
+    Defines the exception raised when some of the queries sent in a
+    SharePoint $batch request fail. The rest of the queries of the
+    request were executed.
+
+    Args:
+        failures (List[Tuple[ClientQuery, Optional[requests.Response]]]):
+        Each failed query with the response SharePoint gave to it, or
+        None when the query was not answered.
+
+        total (int): Number of queries sent in the $batch requests.
+    """
+
+    def __init__(
+        self,
+        failures: List[Tuple[ClientQuery, Optional[requests.Response]]],
+        total: int,
+    ):
+        self.failures = failures
+        self.total = total
+        super().__init__(
+            f"{len(failures)} of {total} queries of the $batch request failed, "
+            f"the first one with {_describe_response(failures[0][1])}"
+        )
+
+
+def _describe_response(response: Optional[requests.Response]) -> str:
+    """Returns the status and the SharePoint error message of response."""
+    if response is None:
+        return "no response"
+    try:
+        detail = ClientRequestException(response=response).message
+    except ValueError:
+        detail = None
+    return f"HTTP {response.status_code}" + (f": {detail}" if detail else "")
+
+
+class SharepointRetry(Retry):
+    """
+    Retry policy of the sessions built by create_session. A POST request
+    is not idempotent, SharePoint may have created the item, the folder
+    or the attachment before answering with an error, so it is only
+    retried when SharePoint throttled it (429 or 503) without processing
+    it. The other methods are retried on every status of RETRY_STATUSES.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and status_code in THROTTLE_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def create_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 32,
+    max_retries: int = 6,
+    backoff_factor: float = 0.5,
+    backoff_jitter: float = 0.3,
+    compress: bool = True,
+) -> requests.Session:
+    """
+    The create_session function builds a requests session whose
+    connection pool keeps the TCP and TLS connections to the SharePoint
+    host open between REST calls, so only the first call pays the
+    handshake.
+
+    Args:
+        pool_connections (int, optional): Number of hosts whose
+        connections are kept in the pool. Only one SharePoint host is
+        contacted, so a small value is enough.
+
+        pool_maxsize (int, optional): Maximum number of connections kept
+        open to the same host.
+
+        max_retries (int, optional): Number of times a request is retried
+        when the connection fails or SharePoint answers with a throttling
+        or transient error status. POST requests are only retried when
+        they were throttled, see SharepointRetry. When the answer carries
+        a Retry-After header its wait is respected. This is the only
+        retry layer, the functions of this module do not retry on their
+        own, so in the worst case a request is sent max_retries + 1
+        times, waiting before each retry what Retry-After asks for or
+        backoff_factor * 2 ** (retry - 1) seconds, capped at 120, plus
+        up to backoff_jitter seconds.
+
+        backoff_factor (float, optional): Factor applied to the
+        exponential wait between retries.
+
+        backoff_jitter (float, optional): Maximum random number of
+        seconds added to every wait, so concurrent workers throttled at
+        the same time do not retry in lockstep. It is ignored by urllib3
+        versions older than 2.0.
+
+        compress (bool, optional): If True the responses are requested
+        with gzip or deflate encoding and inflated transparently, the
+        JSON returned by SharePoint compresses several times. Set it to
+        False to receive plain responses, for example while debugging.
+
+    Returns:
+        requests.Session: Session to be shared by the client contexts.
+    """
+    retry_options = {
+        "total": max_retries,
+        "backoff_factor": backoff_factor,
+        "status_forcelist": RETRY_STATUSES,
+        "allowed_methods": RETRY_METHODS,
+        "respect_retry_after_header": True,
+        "raise_on_status": False,
+    }
+    if "backoff_jitter" in inspect.signature(Retry).parameters:
+        retry_options["backoff_jitter"] = backoff_jitter
+    retries = SharepointRetry(**retry_options)
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+    )
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.headers["Accept-Encoding"] = "gzip, deflate" if compress else "identity"
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_default_session = None
+
+
+def get_default_session() -> requests.Session:
+    """
+    Returns the process wide session used by the client contexts that
+    are created without an explicit session.
+
+    Returns:
+        requests.Session: Shared session.
+    """
+    global _default_session
+    if _default_session is None:
+        _default_session = create_session()
+    return _default_session
+
+
+class PooledRequestExecutor(ClientRequest):
+    """
+    Client request that sends the HTTP calls through the session of
+    its PooledClientContext instead of the module level functions of
+    requests, which open a new connection on every call.
+    """
+
+    def execute_request_direct(self, request):
+        self.context.authenticate_request(request)
+        options = {
+            "headers": request.headers,
+            "auth": request.auth,
+            "verify": request.verify,
+            "proxies": request.proxies,
+        }
+        if request.method == HttpMethod.Post:
+            if request.is_bytes or request.is_file:
+                options["data"] = request.data
+            else:
+                options["json"] = request.data
+        elif request.method == HttpMethod.Patch:
+            options["json"] = request.data
+        elif request.method == HttpMethod.Put:
+            options["data"] = request.data
+        elif request.method != HttpMethod.Delete:
+            options["stream"] = request.stream
+        return self.context.session.request(request.method, request.url, **options)
+
+
+class PooledODataRequest(ODataRequest, PooledRequestExecutor):
+    """OData request sent through the pooled session."""
+
+
+class PooledBatchRequest(ODataBatchRequest, PooledRequestExecutor):
+    """
+    OData $batch request sent through the pooled session. SharePoint
+    nests the answers of the changes inside a changeset part, which
+    ODataBatchRequest does not read, so the parts of every level are
+    read here. The queries that fail are kept in failures instead of
+    stopping the processing of the others.
+    """
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.failures = []
+        self.total = 0
+
+    def _extract_response(self, response):
+        content_type = response.headers["Content-Type"].encode("ascii")
+        message = message_from_bytes_or_string(
+            b"Content-Type: " + content_type + b"\r\n\r\n" + response.content
+        )
+        # walk also visits the parts of the changesets, in their order
+        for part in message.walk():
+            if part.get_content_type() == "application/http":
+                yield self._deserialize_response(part)
+
+    def process_response(self, batch_response):
+        queries = self.current_query.ordered_queries
+        responses = list(self._extract_response(batch_response))
+        self.total += len(queries)
+        for index, query in enumerate(queries):
+            response = responses[index] if index < len(responses) else None
+            if response is None or not response.ok:
+                self.failures.append((query, response))
+                continue
+            self.context.pending_request().add_query(query, reset_queue=True)
+            self.context.pending_request().process_response(response)
+        self.context.pending_request().clear()
+
+
+class PooledClientContext(ClientContext):
+    """
+    SharePoint client context whose requests reuse the connections of
+    a shared requests session.
+    """
+
+    def __init__(self, base_url: str, auth_context=None, session: requests.Session = None):
+        super().__init__(base_url, auth_context)
+        self.session = session if session is not None else get_default_session()
+
+    def pending_request(self):
+        if self._pending_request is None:
+            self._pending_request = PooledODataRequest(self, JsonLightFormat())
+            self._pending_request.beforeExecute += self._build_modification_query
+        return self._pending_request
+
+    def execute_batch(self, items_per_batch=100):
+        batch_request = PooledBatchRequest(self)
+
+        def _prepare_batch_request(request):
+            self.ensure_form_digest(request)
+
+        batch_request.beforeExecute += _prepare_batch_request
+
+        all_queries = [qry for qry in self.pending_request()]
+        for i in range(0, len(all_queries), items_per_batch):
+            batch_request.add_query(BatchQuery(self, all_queries[i:i + items_per_batch]))
+            batch_request.execute_query()
+        if batch_request.failures:
+            raise SharepointBatchErrors(batch_request.failures, batch_request.total)
+        return self
+
+
+def clone_context(ctx: ClientContext) -> PooledClientContext:
+    """
+    The clone_context function returns a new client context for the
+    same site that shares the authentication and the session of ctx but
+    has its own pending query queue, so it can be used from another
+    thread. The form digest already obtained by ctx is reused.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment.
+
+    Returns:
+        PooledClientContext: The new client context.
+    """
+    clone = PooledClientContext(
+        ctx.base_url, ctx.authentication_context, getattr(ctx, "session", None)
+    )
+    # The form digest is valid for the whole site, reusing it saves the
+    # request that the clone would send before its first change.
+    clone._ctx_web_info = ctx._ctx_web_info
+    return clone
+
+
+_app_only_tokens = {}
+_app_only_tokens_lock = threading.Lock()
+
+
+def acquire_app_only_token(
+    url: str, client_id: str, client_secret: str, margin: int = 300
+) -> TokenResponse:
+    """
+    The acquire_app_only_token function returns an app-only access token
+    for the SharePoint site, shared by every client context of the
+    process. The token is requested again only when it expires in less
+    than margin seconds, and a lock ensures that a single thread
+    renews it while the others wait for the result.
+
+    Args:
+        url (str): The SharePoint site URL.
+
+        client_id (str): The client ID of the registered Azure AD application.
+
+        client_secret (str): The client secret associated with the application.
+
+        margin (int, optional): Seconds before the expiration at which
+        the token is renewed. It has a default value of 300.
+
+    Returns:
+        TokenResponse: Valid access token.
+    """
+    key = (url, client_id)
+    with _app_only_tokens_lock:
+        token, expiry = _app_only_tokens.get(key, (None, 0))
+        if time.time() >= expiry - margin:
+            token = ACSTokenProvider(url, client_id, client_secret).get_app_only_access_token()
+            expiry = time.time() + int(getattr(token, "expiresIn", 3600))
+            _app_only_tokens[key] = (token, expiry)
+    return token
+
+
+class AppOnlyAuthenticationContext(AuthenticationContext):
+    """
+    Authentication context that signs every request with the shared
+    app-only token of acquire_app_only_token, renewing it when it is
+    about to expire.
+    """
+
+    def __init__(self, url: str, client_id: str, client_secret: str):
+        super().__init__(url)
+        self.client_id = client_id
+        self.client_secret = client_secret
+
+    def authenticate_request(self, request):
+        token = acquire_app_only_token(self.authority_url, self.client_id, self.client_secret)
+        request.set_header("Authorization", "Bearer {0}".format(token.accessToken))
+
+
+_user_auth_contexts = {}
+_user_auth_contexts_lock = threading.Lock()
+
+
+def acquire_user_authentication(
+    url: str, username: str, password: str, ttl: int = 3600, margin: int = 60
+) -> Optional[AuthenticationContext]:
+    """
+    The acquire_user_authentication function returns an authentication
+    context of the user for the SharePoint site, shared by every client
+    context of the process. The authentication cookies are requested
+    again only when they were obtained more than ttl - margin seconds
+    ago, and a lock ensures that a single thread renews them while the
+    others wait for the result.
+
+    Args:
+        url (str): sharepoint url
+
+        username (str): username like something@anla.gov.co
+
+        password (str): password of the username
+
+        ttl (int, optional): Seconds during which the authentication
+        cookies are considered valid. It has a default value of 3600.
+
+        margin (int, optional): Seconds before the end of ttl at which
+        the cookies are renewed. It has a default value of 60.
+
+    Returns:
+        Optional[AuthenticationContext]: The authenticated context, or
+        None when the authentication failed.
+    """
+    key = (url, username)
+    with _user_auth_contexts_lock:
+        ctx_auth, expiry = _user_auth_contexts.get(key, (None, 0))
+        if time.time() >= expiry - margin:
+            ctx_auth = AuthenticationContext(url)
+            if not ctx_auth.acquire_token_for_user(username, password):
+                _user_auth_contexts.pop(key, None)
+                return None
+            _user_auth_contexts[key] = (ctx_auth, time.time() + ttl)
+    return ctx_auth
+
+
+def get_connection_sharepoint(
+    url: str,
+    username: str,
+    password: str,
+    session: requests.Session = None,
+    eager: bool = False,
+) -> ClientContext:
     """
     This function establish a connection to a SharePoint site using the
-    provided URL, username, and password.
+    provided URL, username, and password. The authentication of the
+    user is cached for the whole process with
+    acquire_user_authentication, so new contexts do not negotiate it
+    again.
 
     Args:
         url (str): sharepoint url
@@ -61,60 +532,138 @@ def get_connection_sharepoint(url: str, username: str, password: str) -> ClientC
 
         password (str): password of the username
 
+        session (requests.Session, optional): Session whose connections
+        are reused by the context. The process wide session is used
+        when it is not provided.
+
+        eager (bool, optional): If True the properties of the site are
+        loaded before returning, which also checks the access to it.
+        Otherwise no request is sent until the context is used. It has
+        a default value of False.
+
     Returns:
         ClientContext: object representing a client context in a
         SharePoint environment. A ClientContext typically provides
         access to SharePoint resources and operations.
+
+    Raises:
+        SharepointErrors: If the user can not be authenticated.
     """
 
-    ctx_auth = AuthenticationContext(url)
-    if ctx_auth.acquire_token_for_user(username, password):
-        ctx = ClientContext(url, ctx_auth)
-        web = ctx.web
-        ctx.load(web)
+    ctx_auth = acquire_user_authentication(url, username, password)
+    if ctx_auth is None:
+        raise SharepointErrors(f"Authentication to {url} failed for user {username}")
+    ctx = PooledClientContext(url, ctx_auth, session)
+    if eager:
+        ctx.load(ctx.web)
         ctx.execute_query()
-        return ctx
-    else:
-        print(f"The connection to {url} failed")
+    return ctx
 
-def get_connection_sharepoint_token(url: str, client_id: str, client_secret: str) -> None:
+
+def get_connection_sharepoint_token(
+    url: str,
+    client_id: str,
+    client_secret: str,
+    session: requests.Session = None,
+    eager: bool = False,
+) -> ClientContext:
     """
     Establish a connection to a SharePoint site using client credentials.
 
     This function authenticates against a SharePoint Online site by 
     creating a `ClientContext` object with the provided client ID and 
     client secret. Once the context is successfully authenticated, 
-    it can be used to interact with SharePoint resources.
+    it can be used to interact with SharePoint resources. The access
+    token is cached for the whole process and renewed before it
+    expires, so new contexts do not negotiate it again.
 
     Args:
         url (str): The SharePoint site URL to connect to.
         client_id (str): The client ID of the registered Azure AD application.
         client_secret (str): The client secret associated with the application.
+        session (requests.Session, optional): Session whose connections
+            are reused by the context. The process wide session is used
+            when it is not provided.
+        eager (bool, optional): If True the properties of the site are
+            loaded before returning, which checks the credentials right
+            away. Otherwise no request is sent until the context is used.
 
     Returns:
         ClientContext: An authenticated SharePoint client context object 
         that can be used to access and manipulate SharePoint resources.
 
     Raises:
-        ClientRequestException: If authentication fails or the request 
-            to SharePoint cannot be executed.
+        ClientRequestException: If eager is True and authentication fails
+            or the request to SharePoint cannot be executed.
         Exception: For any unexpected errors during the connection setup.
     """
-    credentials = ClientCredential(client_id, client_secret)
-    ctx = ClientContext(url).with_credentials(credentials)
-    web = ctx.web
-    ctx.load(web)
-    ctx.execute_query()
+    if url.endswith("/"):
+        url = url[:-1]
+    auth_context = AppOnlyAuthenticationContext(url, client_id, client_secret)
+    ctx = PooledClientContext(url, auth_context, session)
+    if eager:
+        ctx.load(ctx.web)
+        ctx.execute_query()
     return ctx
 
 
+_context_memos = weakref.WeakKeyDictionary()
+_context_memos_lock = threading.Lock()
+
+
+def _context_memo(ctx: ClientContext, name: str) -> dict:
+    """
+    Returns the dictionary where the results of the operation name are
+    kept for ctx. It is released together with the client context.
+    """
+    with _context_memos_lock:
+        memos = _context_memos.get(ctx)
+        if memos is None:
+            memos = _context_memos[ctx] = {}
+        return memos.setdefault(name, {})
+
+
+def clear_context_cache(ctx: ClientContext, name: str = None, key=None) -> None:
+    """
+    The clear_context_cache function removes the results that
+    get_connection_list, get_connection_folder and get_email_user keep
+    for ctx, so the next call resolves them again. Removing the lists
+    also removes the field types that get_list_schema keeps for them,
+    so the columns added to a list are taken into account.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment.
+
+        name (str, optional): Kind of result to remove, "lists",
+        "folders" or "emails". Every kind is removed when it is not
+        provided.
+
+        key (optional): List name, folder name or user ID to remove. Every
+        result of the kind is removed when it is not provided.
+    """
+    if name in (None, "lists"):
+        clear_list_schemas(ctx, key)
+    with _context_memos_lock:
+        memos = _context_memos.get(ctx)
+        if memos is None:
+            return
+        if name is None:
+            memos.clear()
+        elif key is None:
+            memos.pop(name, None)
+        else:
+            memos.get(name, {}).pop(key, None)
+
+
 def get_connection_list(ctx: ClientContext, list_name: str) -> ListSharepoint:
     """
     This function takes a SharePoint client context (ctx) and the name
     of a SharePoint list (list_name) as inputs. It then uses the client
     context to access the SharePoint web and retrieves the SharePoint
     list specified by its title. The function ultimately returns the
-    SharePoint list object.
+    SharePoint list object, which is reused by the following calls with
+    the same client context and list name.
 
     Args:
         ctx (ClientContext): object representing a client context in a
@@ -129,7 +678,13 @@ def get_connection_list(ctx: ClientContext, list_name: str) -> ListSharepoint:
         a SharePoint list.
     """
 
-    return ctx.web.lists.get_by_title(list_name)
+    connections = _context_memo(ctx, "lists")
+    list_sharepoint = connections.get(list_name)
+    if list_sharepoint is None:
+        list_sharepoint = connections[list_name] = ctx.web.lists.get_by_title(
+            list_name
+        )
+    return list_sharepoint
 
 
 def get_connection_folder(ctx: ClientContext, folder_name: str) -> ListSharepoint:
@@ -139,7 +694,8 @@ def get_connection_folder(ctx: ClientContext, folder_name: str) -> ListSharepoin
     folder (folder_name) as inputs. It uses the client context to access
     the SharePoint web and retrieves the SharePoint folder specified by
     its server-relative URL. The function ultimately returns the
-    SharePoint folder object.
+    SharePoint folder object, which is reused by the following calls
+    with the same client context and folder name.
 
      Args:
          ctx (ClientContext): object representing a client context in a
@@ -154,11 +710,21 @@ def get_connection_folder(ctx: ClientContext, folder_name: str) -> ListSharepoin
          a SharePoint list.
     """
 
-    return ctx.web.get_folder_by_server_relative_url(folder_name)
+    connections = _context_memo(ctx, "folders")
+    folder = connections.get(folder_name)
+    if folder is None:
+        folder = connections[folder_name] = ctx.web.get_folder_by_server_relative_url(
+            folder_name
+        )
+    return folder
 
 
 def get_info_folders(
-    ctx: ClientContext, folder_sharepoint: ListSharepoint
+    ctx: ClientContext,
+    folder_sharepoint: ListSharepoint,
+    defer: bool = False,
+    select: List[str] = None,
+    expand: List[str] = None,
 ) -> FolderCollection:
     """
     It retrieves the collection of folders within the specified
@@ -174,20 +740,40 @@ def get_info_folders(
         folder_sharepoint (ListSharepoint): It expects an object
         representing a SharePoint list.
 
+        defer (bool, optional): If True the query is only queued in the
+        client context and the collection is filled when the pending
+        queries are executed, for example with ctx.execute_batch().
+
+        select (List[str], optional): Properties of the folders to
+        retrieve, for example ["Name", "ServerRelativeUrl"]. All the
+        properties are retrieved when it is not provided.
+
+        expand (List[str], optional): Related objects of the folders
+        retrieved with them, for example ["ListItemAllFields"].
+
     Returns:
         folders: The function then returns the retrieved folders
         collection.
     """
 
     folders = folder_sharepoint.folders
+    if select is not None:
+        folders.select(select)
+    if expand:
+        folders.expand(expand)
     ctx.load(folders)
-    ctx.execute_query()
+    if not defer:
+        ctx.execute_query()
 
     return folders
 
 
 def get_info_files(
-    ctx: ClientContext, file_sharepoint: ListSharepoint
+    ctx: ClientContext,
+    file_sharepoint: ListSharepoint,
+    defer: bool = False,
+    select: List[str] = None,
+    expand: List[str] = None,
 ) -> FileCollection:
     """
     It retrieves the collection of files within the specified SharePoint
@@ -204,29 +790,252 @@ def get_info_files(
         file_sharepoint (ListSharepoint): It expects an object
         representing a SharePoint list.
 
+        defer (bool, optional): If True the query is only queued in the
+        client context and the collection is filled when the pending
+        queries are executed, for example with ctx.execute_batch().
+
+        select (List[str], optional): Properties of the files to
+        retrieve, for example ["Name", "ServerRelativeUrl"]. All the
+        properties are retrieved when it is not provided.
+
+        expand (List[str], optional): Related objects of the files
+        retrieved with them, for example ["ListItemAllFields"].
+
     Returns:
         files: the function will return a collection of SharePoint
         files.
     """
 
     files = file_sharepoint.files
+    if select is not None:
+        files.select(select)
+    if expand:
+        files.expand(expand)
     ctx.load(files)
-    ctx.execute_query()
+    if not defer:
+        ctx.execute_query()
 
     return files
 
 
+def get_folder_contents(
+    ctx: ClientContext, folder_sharepoint: Folder, defer: bool = False
+) -> Tuple[FolderCollection, FileCollection]:
+    """
+    It retrieves the subfolders and the files of the specified
+    SharePoint folder with a single request, expanding the Folders and
+    Files properties of the folder instead of loading each collection
+    on its own.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment. A ClientContext typically provides
+         access to SharePoint resources and operations.
+
+        folder_sharepoint (Folder): It expects an object representing a
+        SharePoint folder.
+
+        defer (bool, optional): If True the query is only queued in the
+        client context and the collections are filled when the pending
+        queries are executed, for example with ctx.execute_batch().
+
+    Returns:
+        Tuple[FolderCollection, FileCollection]: The folders and the
+        files collections of the folder.
+    """
+
+    # A new object is expanded so the stored folder connection keeps
+    # its own query options.
+    folder = Folder(ctx, folder_sharepoint.resource_path)
+    # The collections are attached to the folder before the query is
+    # sent, so a deferred response fills the returned objects.
+    folders, files = folder.folders, folder.files
+    folder.set_property("Folders", folders, persist_changes=False)
+    folder.set_property("Files", files, persist_changes=False)
+    folder.expand(["Folders", "Files"]).get()
+    if not defer:
+        ctx.execute_query()
+
+    return folders, files
+
+
+class FieldSchema(NamedTuple):
+    """
+    Defines the type of a field of a SharePoint list and whether it is
+    indexed, as returned by get_list_schema.
+
+    Args:
+        type (str): TypeAsString of the field, for example "Text".
+
+        indexed (bool): True if the field has an index, so SharePoint can
+        filter by it a list bigger than the list view threshold.
+    """
+
+    type: str
+    indexed: bool
+
+
+_list_schemas = {}
+
+
+def get_list_schema(
+    ctx: ClientContext, list_sharepoint: ListSharepoint
+) -> Dict[str, FieldSchema]:
+    """
+    The get_list_schema function returns the type of every field of a
+    SharePoint list and whether it is indexed, keyed by its internal
+    name. The fields are loaded once per list, identified by its site
+    and title, and reused by every later connection to it until
+    clear_list_schemas removes them.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment. A ClientContext typically provides
+         access to SharePoint resources and operations.
+
+        list_sharepoint (ListSharepoint): It expects an object
+        representing a SharePoint list.
+
+    Returns:
+        Dict[str, FieldSchema]: Type of each field by InternalName.
+    """
+    key = list_sharepoint.resource_url
+    schema = _list_schemas.get(key)
+    if schema is None:
+        fields = list_sharepoint.fields.select(["InternalName", "TypeAsString", "Indexed"])
+        ctx.load(fields)
+        ctx.execute_query()
+        schema = {
+            field.properties["InternalName"]: FieldSchema(
+                field.properties["TypeAsString"], bool(field.properties.get("Indexed"))
+            )
+            for field in fields
+        }
+        _list_schemas[key] = schema
+    return schema
+
+
+def clear_list_schemas(ctx: ClientContext, list_name: str = None) -> None:
+    """
+    The clear_list_schemas function removes the field types that
+    get_list_schema keeps for the lists of the site of ctx, so they are
+    loaded again on the next call.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment.
+
+        list_name (str, optional): Title of the list whose fields are
+        removed. The fields of every list of the site are removed when
+        it is not provided.
+    """
+    if list_name is not None:
+        _list_schemas.pop(ctx.web.lists.get_by_title(list_name).resource_url, None)
+        return
+    site_url = ctx.service_root_url()
+    for key in [key for key in list(_list_schemas) if key.startswith(site_url)]:
+        _list_schemas.pop(key, None)
+
+
+def escape_odata(value: str) -> str:
+    """
+    Escapes a value to be used as an OData string literal.
+
+    Args:
+        value (str): Value to escape.
+
+    Returns:
+        str: The value with its single quotes doubled.
+    """
+    return value.replace("'", "''")
+
+
+@lru_cache(maxsize=4096)
+def _build_odata_filter(
+    conditions: FrozenSet[Tuple[str, str, Optional[str]]]
+) -> Optional[str]:
+    """
+    Builds the $filter expression of the (column, value, field type)
+    conditions that can be translated, the others are skipped.
+    """
+    expressions = []
+    for column, value, field_type in sorted(conditions, key=str):
+        if field_type in ODATA_TEXT_FIELDS:
+            literal = f"'{escape_odata(value)}'"
+        elif field_type in ODATA_NUMBER_FIELDS and ODATA_NUMBER_PATTERN.fullmatch(value):
+            literal = value
+        elif field_type == "Boolean" and value in ("True", "False"):
+            literal = "1" if value == "True" else "0"
+        else:
+            continue
+        expressions.append(f"{column} eq {literal}")
+    return " and ".join(expressions) or None
+
+
+def build_odata_filter(
+    filters: List[Information], schema: Dict[str, FieldSchema]
+) -> Optional[str]:
+    """
+    The build_odata_filter function translates the filters of
+    get_info_list into an OData $filter expression. Only the filters on
+    indexed text, choice, numeric and boolean fields are translated: on
+    a list bigger than the list view threshold (5000 items) SharePoint
+    rejects a $filter on a column without index. The filters on other
+    fields, or on columns that are not in the schema, are left out of
+    the expression and must be evaluated in Python by the caller.
+    Expressions are memoized, so repeated filters are not built again.
+
+    Args:
+        filters (List[Information]): Column and value pairs that the
+        items must match.
+
+        schema (Dict[str, FieldSchema]): Fields of the list, as returned
+        by get_list_schema.
+
+    Returns:
+        Optional[str]: The $filter expression, or None when none of the
+        filters can be evaluated by SharePoint.
+    """
+    return _build_odata_filter(
+        frozenset(
+            (query.column, query.value, _filterable_type(schema.get(query.column)))
+            for query in filters
+        )
+    )
+
+
+def _filterable_type(field: Optional[FieldSchema]) -> Optional[str]:
+    """Returns the type of field if SharePoint can filter by it, or None."""
+    if field is None:
+        return None
+    if field.indexed or field.type in ODATA_ALWAYS_INDEXED_FIELDS:
+        return field.type
+    return None
+
+
 def get_info_list(
     ctx: ClientContext,
     list_sharepoint: ListSharepoint,
     filters: List[Information] = None,
+    defer: bool = False,
+    select: List[str] = None,
+    expand: List[str] = None,
+    page_size: int = 2000,
+    materialize: bool = True,
 ) -> ListItem:
     """
     The get_info_list function takes a SharePoint client context (ctx),
     a SharePoint list object (list_sharepoint), and an optional list of
     filters (filters). It retrieves the items from the specified
     SharePoint list, applies filters if provided, and returns the
-    resulting items.
+    resulting items. The filters on indexed columns are sent to
+    SharePoint as an OData $filter expression, so only the matching
+    items are transferred; the filters on columns without index, which
+    SharePoint rejects on lists over the list view threshold, or that it
+    can not evaluate, are applied in Python. SharePoint compares text without
+    case, so the items it returns are compared again in Python and the
+    result is always an exact match of the filters, whichever way they
+    were evaluated. The items are requested in pages of page_size items.
 
     Args:
         ctx (ClientContext): object representing a client context in a
@@ -239,37 +1048,78 @@ def get_info_list(
         filters (List[Information], optional):  It represents
         information used for filtering the items in the list.
 
+        defer (bool, optional): If True the query is only queued in the
+        client context and the items collection is filled when the
+        pending queries are executed, for example with
+        ctx.execute_batch(). Filters can not be applied to a deferred
+        query.
+
+        select (List[str], optional): Internal names of the columns to
+        retrieve. All the columns are retrieved when it is not provided.
+
+        expand (List[str], optional): Lookup or person columns whose
+        values are retrieved with the items, for example ["Author"]
+        together with "Author/Title" in select.
+
+        page_size (int, optional): Number of items requested in every
+        page. It has a default value of 2000.
+
+        materialize (bool, optional): If True every page is loaded
+        before returning. If False only the first page is loaded and the
+        following ones are requested while the result is iterated, so
+        the caller can stop early; the filtered items are then returned
+        as an iterator. It has a default value of True.
+
     Returns:
         ListItem: The function returns either the filtered items list or
         the original items collection, depending on the presence of
         filters.
     """
 
-    items = list_sharepoint.items
+    if defer and filters is not None:
+        raise SharepointErrors("Filters can not be applied to a deferred query")
+    items = list_sharepoint.items.top(page_size).paged(True)
+    if select is not None:
+        items.select(select)
+    if expand:
+        items.expand(expand)
+    expression = None
+    if filters:
+        expression = build_odata_filter(filters, get_list_schema(ctx, list_sharepoint))
+        if expression is not None:
+            items.filter(expression)
+        if select is not None:
+            items.select(list(select) + [query.column for query in filters])
     ctx.load(items)
+    if defer:
+        return items
     ctx.execute_query()
+    if filters is None:
+        if materialize:
+            # Iterating requests the remaining pages into the collection
+            for _ in items:
+                pass
+        return items
+    # The columns and values are read from the filters once, not per row
+    columns = tuple(query.column for query in filters)
+    target = tuple(query.value for query in filters)
     items = (
-        [
-            item
-            for item in items
-            if all(
-                str(item.properties[query.column]) == query.value for query in filters
-            )
-        ]
-        if filters is not None
-        else items
+        item
+        for item in items
+        if tuple(str(item.properties[column]) for column in columns) == target
     )
 
-    return items
+    return list(items) if materialize else items
 
 
 def get_email_user(ctx: ClientContext, professional_id: int) -> str:
     """
     The get_email_user function takes a SharePoint client context (ctx)
-    and a professional ID (professional_id). It retrieves the SharePoint
-    site users, searches for a user with a matching ID, and returns the
-    email address of that user if found. If no match is found,
-    it returns None.
+    and a professional ID (professional_id). It retrieves only the
+    SharePoint site user with that ID, and returns the email address of
+    that user if found. If no match is found, it returns None. The
+    emails found are kept for the client context, so a user is only
+    requested once.
 
     Args:
         ctx (ClientContext): object representing a client context in a
@@ -282,13 +1132,47 @@ def get_email_user(ctx: ClientContext, professional_id: int) -> str:
     Returns:
         str: Sharepoint user mail
     """
-    users = ctx.web.site_users
+    emails = _context_memo(ctx, "emails")
+    if professional_id in emails:
+        return emails[professional_id]
+    user = ctx.web.site_users.get_by_id(professional_id)
+    ctx.load(user, ["UserPrincipalName"])
+    try:
+        ctx.execute_query()
+    except ClientRequestException as error:
+        if error.response.status_code != 404:
+            raise
+        return None
+    email = user.properties.get("UserPrincipalName")
+    if email is not None:
+        emails[professional_id] = email
+    return email
+
+
+def get_users_emails(ctx: ClientContext) -> Dict[int, str]:
+    """
+    The get_users_emails function retrieves every SharePoint site user
+    with a single request and returns the mapping from the user ID to
+    its email, so many users can be resolved without a request for
+    each one.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment. A ClientContext typically provides
+         access to SharePoint resources and operations.
+
+    Returns:
+        Dict[int, str]: Sharepoint user mail by user ID, the users
+        without mail are left out.
+    """
+    users = ctx.web.site_users.select(["Id", "UserPrincipalName"])
     ctx.load(users)
     ctx.execute_query()
-    for user in users:
-        if user.properties["Id"] == professional_id:
-            return user.properties["UserPrincipalName"]
-    return None
+    return {
+        user.properties["Id"]: user.properties["UserPrincipalName"]
+        for user in users
+        if user.properties.get("UserPrincipalName")
+    }
 
 
 def extract_attachment_files(
@@ -328,9 +1212,10 @@ def update_list(
     The update_list function takes a SharePoint client context (ctx), a
     SharePoint list object (list_sharepoint), an item ID (id_item), and
     a list of information to update (update_info). It retrieves the
-    specified item from the SharePoint list, updates the specified
-    information on the item, and saves the changes back to the server.
-    If the item is not found, an exception is raised.
+    specified item from the SharePoint list by its ID, sets the
+    specified information on the item, and saves all the changes back
+    to the server in a single request. If the item is not found, an
+    exception is raised.
 
     Args:
         ctx (ClientContext): object representing a client context in a
@@ -347,20 +1232,109 @@ def update_list(
         information to update on the SharePoint item.
     """
 
-    items = list_sharepoint.items
+    item = list_sharepoint.get_item_by_id(id_item)
+    for information in update_info:
+        item.set_property(information.column, information.value)
+
+    def _update_item():
+        item.ensure_type_name(list_sharepoint)
+        item.update()
+
+    # The entity type name is kept in the list object, so only the first
+    # update of a list needs to read it before sending the changes.
+    list_sharepoint.ensure_property("ListItemEntityTypeFullName", _update_item)
+    try:
+        ctx.execute_query()
+    except ClientRequestException as error:
+        if error.response.status_code != 404:
+            raise
+        raise SharepointErrors(
+            f"The item {id_item} do nor exist in the sharepoint list"
+        ) from error
+
+
+def bulk_update(
+    ctx: ClientContext,
+    list_sharepoint: ListSharepoint,
+    filters: Union[str, List[Information]],
+    update_info: List[Information],
+    page_size: int = 2000,
+) -> int:
+    """
+    The bulk_update function sets the information of update_info on every
+    item of the SharePoint list that matches filters. SharePoint selects
+    the matching items and only their IDs are transferred, then all the
+    updates are sent together in $batch requests instead of calling
+    update_list for every item. Column and value filters are evaluated
+    as in get_info_list: SharePoint only filters by the indexed columns
+    and every filter is compared exactly in Python.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment. A ClientContext typically provides
+         access to SharePoint resources and operations.
+
+        list_sharepoint (ListSharepoint): It expects an object
+        representing a SharePoint list.
+
+        filters (Union[str, List[Information]]): OData $filter expression
+        or column and value pairs, as in get_info_list, that the items to
+        update must match.
+
+        update_info (List[Information]): Represents the list of
+        information to update on the SharePoint items.
+
+        page_size (int, optional): Number of IDs requested in every page.
+        It has a default value of 2000.
+
+    Returns:
+        int: Number of updated items.
+
+    Raises:
+        SharepointErrors: If some of the updates failed, the message
+        tells how many items were updated and the IDs of the items that
+        were not.
+    """
+    columns, target = (), ()
+    if not isinstance(filters, str):
+        columns = tuple(query.column for query in filters)
+        target = tuple(query.value for query in filters)
+        filters = build_odata_filter(filters, get_list_schema(ctx, list_sharepoint))
+    items = list_sharepoint.items.select(["Id", *columns]).top(page_size).paged(True)
+    if filters:
+        items.filter(filters)
     ctx.load(items)
+    if not list_sharepoint.is_property_available("ListItemEntityTypeFullName"):
+        ctx.load(list_sharepoint, ["ListItemEntityTypeFullName"])
     ctx.execute_query()
-    item_selection = [item for item in items if item.properties["Id"] == id_item]
-    if item_selection:
-        item = item_selection[0]
+    # SharePoint compares text without case and only filters the indexed
+    # columns, the matches are checked exactly
+    item_ids = [
+        item.properties["Id"]
+        for item in items
+        if tuple(str(item.properties[column]) for column in columns) == target
+    ]
+    if not item_ids:
+        return 0
+
+    ids_by_item = {}
+    for item_id in item_ids:
+        item = list_sharepoint.get_item_by_id(item_id)
         for information in update_info:
             item.set_property(information.column, information.value)
-            item.update()
-            ctx.execute_query()
-    else:
+        item.ensure_type_name(list_sharepoint)
+        item.update()
+        ids_by_item[id(item)] = item_id
+    try:
+        ctx.execute_batch()
+    except SharepointBatchErrors as error:
+        failed = [ids_by_item.get(id(query.binding_type)) for query, _ in error.failures]
         raise SharepointErrors(
-            f"The item {id_item} do nor exist in the sharepoint list"
-        )
+            f"{len(item_ids) - len(failed)} of {len(item_ids)} items were updated, "
+            f"the items {failed} failed, the first one with "
+            f"{_describe_response(error.failures[0][1])}"
+        ) from error
+    return len(item_ids)
 
 
 def create_list(ctx: ClientContext, list_name: str) -> None:
@@ -381,23 +1355,62 @@ def create_list(ctx: ClientContext, list_name: str) -> None:
     list_creation.BaseTemplate = ListTemplateType.GenericList
     list_creation.Title = list_name
     list_creation.AllowContentTypes = True
-    ctx.web.lists.add(list_creation).execute_query()
+    ctx.web.lists.add(list_creation)
+    ctx.execute_query()
+
+
+Blob = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+
+@contextmanager
+def _open_blob(source: Blob) -> Iterator[Tuple[BinaryIO, int]]:
+    """
+    Yields a binary stream with the content of source, positioned at its
+    beginning, and its size in bytes, without copying the content into
+    memory. A path is opened as a read only memory map, bytes are
+    wrapped and a seekable stream is used as it is. A stream that can
+    not be rewound is read, since a retried request has to send it
+    again.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            # Empty files can not be mapped
+            if size == 0:
+                yield io.BytesIO(), 0
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content, size
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        yield io.BytesIO(source), memoryview(source).nbytes
+    elif hasattr(source, "read"):
+        if not (hasattr(source, "seekable") and source.seekable()):
+            source = io.BytesIO(source.read())
+        size = source.seek(0, io.SEEK_END)
+        source.seek(0)
+        yield source, size
+    else:
+        raise TypeError(
+            "El argumento debe ser una ruta de archivo, bytes o un objeto binario legible"
+        )
 
 
 def add_new_item(
     ctx: ClientContext,
     list_sharepoint: ListSharepoint,
     information: dict,
-    attachment: str = None,
+    attachment: Blob = None,
+    attachment_name: str = None,
 ) -> None:
     """
     The add_new_item function takes a SharePoint client context (ctx), a
     SharePoint list object (list_sharepoint), a dictionary of
     information for the new item (information), and an optional
-    attachment file path (attachment). It adds a new item to the
-    SharePoint list using the provided information and saves it. If an
-    attachment file is specified, it adds the attachment to the newly
-    created item.
+    attachment (attachment). It adds a new item to the SharePoint list
+    using the provided information and saves it. If an attachment is
+    specified, it adds the attachment to the newly created item in the
+    same execute_query, streaming its content instead of copying it
+    into memory.
 
     Args:
         ctx (ClientContext): object representing a client context in a
@@ -412,19 +1425,63 @@ def add_new_item(
         keys represent the column names and the values represent the
         column values.
 
-        attachment (str, optional): Path to an optional attachment file
-        to be associated with the new item. It has a default value of
-        None.
+        attachment (Blob, optional): Optional attachment to be
+        associated with the new item. It can be a file path, bytes or a
+        binary stream. It has a default value of None.
+
+        attachment_name (str, optional): Name of the attachment. When it
+        is not provided the name of the file path is used, it is required
+        for bytes and streams.
     """
-    item = list_sharepoint.add_item(information)
-    ctx.execute_query()
-    if attachment:
-        with open(attachment, "rb") as file:
-            file_content = file.read()
-        attachment_file_info = AttachmentfileCreationInformation(
-            os.path.basename(attachment), file_content
-        )
-        item.attachment_files.add(attachment_file_info).execute_query()
+    if attachment is not None and attachment_name is None:
+        if not isinstance(attachment, str):
+            raise ValueError(
+                "El argumento attachment_name es obligatorio cuando attachment no es una ruta de archivo"
+            )
+        attachment_name = ntpath.basename(attachment)
+    if attachment is None:
+        list_sharepoint.add_item(information)
+        ctx.execute_query()
+        return
+
+    # The attachment is opened before the item is queued, so a missing
+    # file does not leave the creation of the item pending in ctx.
+    with _open_blob(attachment) as (file_content, _):
+        item = list_sharepoint.add_item(information)
+
+        def _add_attachment():
+            item.attachment_files.add(
+                AttachmentfileCreationInformation(attachment_name, file_content)
+            )
+
+        # The attachment url needs the ID of the new item, so it is
+        # queued once the item is created, within the same execute_query.
+        ctx.after_query_execute(ctx.current_query, _add_attachment)
+        ctx.execute_query()
+
+
+@lru_cache(maxsize=2048)
+def join_rel(*parts: str) -> str:
+    """
+    The join_rel function joins the parts of a SharePoint path with a
+    single "/" between them and without trailing "/", a duplicated slash
+    makes SharePoint answer with a redirect and costs an extra request.
+    The leading "/" of the first part is kept, since it selects a server
+    relative path instead of a path relative to the site. The joined
+    paths are memoized.
+
+    Args:
+        *parts (str): Parts of the path, for example a folder path and
+        the name of a folder inside it.
+
+    Returns:
+        str: The normalized path.
+    """
+    leading = "/" if parts and parts[0].startswith("/") else ""
+    path = "/".join(part.strip("/") for part in parts if part.strip("/"))
+    path = leading + posixpath.normpath(path) if path else leading
+    assert "//" not in path and (path == "/" or not path.endswith("/"))
+    return path
 
 
 def create_folder(ctx: ClientContext, relative_path: str, folder_name: str) -> None:
@@ -445,7 +1502,7 @@ def create_folder(ctx: ClientContext, relative_path: str, folder_name: str) -> N
 
         folder_name (str): Name of the new folder to be created.
     """
-    ctx.web.folders.add(f"{relative_path}/{folder_name}")
+    ctx.web.folders.add(join_rel(relative_path, folder_name))
     ctx.execute_query()
 
 
@@ -455,10 +1512,11 @@ def is_sharepoint_folder(
     """
     The is_sharepoint_folder function takes a SharePoint client
     context (ctx), a relative path of the parent folder (relative_path),
-    and a target folder name (folder_name). It retrieves the sub-folders
-    within the parent folder, checks if the target folder name exists
-    within the sub-folders, and returns a boolean value indicating
-    whether the target folder exists within the SharePoint site.
+    and a target folder name (folder_name). It asks SharePoint only for
+    the Exists property of the target folder, instead of listing the
+    sub-folders of the parent folder, and returns a boolean value
+    indicating whether the target folder exists within the SharePoint
+    site.
 
     Args:
         ctx (ClientContext): object representing a client context in a
@@ -471,25 +1529,108 @@ def is_sharepoint_folder(
         folder_name (str): Name of the new folder to be created.
 
     Returns:
-        bool: The function checks whether folder_name exists within the
-        list_sub_folder list and returns True if it does, or False
+        bool: True if folder_name exists within relative_path, or False
         otherwise.
     """
-    target_folder = ctx.web.get_folder_by_server_relative_url(relative_path)
-    sub_folders = target_folder.folders
-    ctx.load(sub_folders)
+    probe = ctx.web.get_folder_by_server_relative_url(
+        join_rel(relative_path, folder_name)
+    )
+    ctx.load(probe, ["Exists"])
+    try:
+        ctx.execute_query()
+    except ClientRequestException as error:
+        if error.response.status_code != 404:
+            raise
+        return False
+    return bool(probe.properties.get("Exists"))
+
+
+def upload_file_chunked(
+    ctx: ClientContext,
+    target_folder: Folder,
+    file_name: str,
+    file_object: BinaryIO,
+    file_size: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_uploaded: Callable[[int], None] = None,
+) -> File:
+    """
+    The upload_file_chunked function uploads the content of file_object
+    to target_folder through the SharePoint StartUpload, ContinueUpload
+    and FinishUpload operations, reading a single chunk of chunk_size
+    bytes at a time, so the memory used does not depend on the file
+    size and a failed request only resends its own chunk. A file that
+    fits in a single chunk is uploaded with one request instead.
+
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment. A ClientContext typically provides
+         access to SharePoint resources and operations.
+
+        target_folder (Folder): Folder where the file will be uploaded.
+
+        file_name (str): Name of the file in SharePoint.
+
+        file_object (BinaryIO): Readable binary stream with the content
+        to upload, positioned at its beginning.
+
+        file_size (int): Number of bytes to upload.
+
+        chunk_size (int, optional): Size in bytes of every uploaded
+        chunk. It has a default value of 4 MiB.
+
+        chunk_uploaded (Callable[[int], None], optional): Function called
+        after every chunk with the number of bytes uploaded so far.
+
+    Returns:
+        File: The uploaded SharePoint file.
+
+    Raises:
+        ValueError: If chunk_size is not positive or file_object ends
+        before file_size bytes are read.
+    """
+    if chunk_size <= 0:
+        raise ValueError("El argumento chunk_size debe ser mayor que cero")
+    if file_size <= chunk_size:
+        target_file = target_folder.upload_file(file_name, file_object)
+        ctx.execute_query()
+        if chunk_uploaded is not None:
+            chunk_uploaded(file_size)
+        return target_file
+
+    target_file = target_folder.files.add(
+        FileCreationInformation(url=file_name, overwrite=True)
+    )
     ctx.execute_query()
-    list_sub_folder = [
-        sub_folders[index].properties["Name"] for index in range(0, len(sub_folders))
-    ]
-    return folder_name in list_sub_folder
+    upload_id = str(uuid.uuid4())
+    offset = 0
+    while True:
+        chunk = file_object.read(min(chunk_size, file_size - offset))
+        if not chunk:
+            raise ValueError(
+                f"El archivo termino despues de {offset} de {file_size} bytes"
+            )
+        if offset == 0:
+            target_file.start_upload(upload_id, chunk)
+        elif offset + len(chunk) >= file_size:
+            target_file.finish_upload(upload_id, offset, chunk)
+        else:
+            target_file.continue_upload(upload_id, offset, chunk)
+        ctx.execute_query()
+        offset += len(chunk)
+        if chunk_uploaded is not None:
+            chunk_uploaded(offset)
+        if offset >= file_size:
+            return target_file
 
 
 def upload_file_sharepoint(
     ctx: ClientContext,
     relative_path: str,
-    file_upload: Union[str, io.BytesIO],
+    file_upload: Blob,
     file_name: str = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_uploaded: Callable[[int], None] = None,
 ) -> None:
     """
     The upload_file_sharepoint function takes a SharePoint client
@@ -497,7 +1638,9 @@ def upload_file_sharepoint(
     the file to be uploaded (file_upload), and an optional file name
     (file_name). It uploads the file to the specified folder in
     SharePoint, either using the provided file name or extracting it
-    from the file path.
+    from the file path. The content is streamed from the file instead
+    of being loaded in memory, and files bigger than 10 MiB are
+    uploaded in chunks of chunk_size bytes.
 
     Args:
         ctx (ClientContext): object representing a client context in a
@@ -507,23 +1650,52 @@ def upload_file_sharepoint(
         relative_path (str): Relative path of the target folder where
         the file will be uploaded.
 
-        file_upload (Union[str, io.BytesIO]): The file to be uploaded.
-        It can be either a file path (str) or a BytesIO object.
+        file_upload (Blob): The file to be uploaded. It can be a file
+        path (str), bytes or a binary stream such as a BytesIO object.
 
         file_name (str, optional): Desired name of the file in
-        SharePoint. It has a default value of None.
-    """
-    target_folder = ctx.web.get_folder_by_server_relative_url(relative_path)
-    if isinstance(file_upload, str):
-        with open(file_upload, "rb") as file:
-            file_content = file.read()
-    elif isinstance(file_upload, io.BytesIO):
-        file_content = file_upload.getvalue()
-    else:
-        raise TypeError("El argumento file_upload debe ser una ruta de archivo o un objeto io.BytesIO")
+        SharePoint. When it is not provided the name of the file path is
+        used, it is required for bytes and streams.
+
+        chunk_size (int, optional): Size in bytes of every chunk of a
+        chunked upload. It has a default value of 4 MiB.
+
+        chunk_uploaded (Callable[[int], None], optional): Function called
+        with the number of bytes uploaded so far, after every chunk of a
+        chunked upload or once when the file is sent in one request.
+
+    Raises:
+        ValueError: If chunk_size is not positive, or if file_name is not
+        provided for bytes and streams.
+    """
+    if chunk_size <= 0:
+        raise ValueError("El argumento chunk_size debe ser mayor que cero")
+    target_folder = ctx.web.get_folder_by_server_relative_url(join_rel(relative_path))
     if file_name is None:
-        file_name = file_upload.split("\\")[-1]
-    target_folder.upload_file(file_name, file_content).execute_query()
+        if not isinstance(file_upload, str):
+            raise ValueError(
+                "El argumento file_name es obligatorio cuando file_upload no es una ruta de archivo"
+            )
+        # ntpath splits on both "\\" and "/", so Windows and POSIX
+        # paths are accepted on every platform.
+        file_name = ntpath.basename(file_upload)
+    with _open_blob(file_upload) as (file, file_size):
+        if file_size > CHUNKED_UPLOAD_THRESHOLD:
+            upload_file_chunked(
+                ctx,
+                target_folder,
+                file_name,
+                file,
+                file_size,
+                chunk_size,
+                chunk_uploaded,
+            )
+        else:
+            target_folder.upload_file(file_name, file)
+            ctx.execute_query()
+            if chunk_uploaded is not None:
+                chunk_uploaded(file_size)
+
 
 def delete_item_list(ctx: ClientContext, item: ListItem) -> None:
     """
@@ -537,36 +1709,187 @@ def delete_item_list(ctx: ClientContext, item: ListItem) -> None:
     ctx.execute_query()
 
 
-def delete_folder_with_contents(ctx: ClientContext, folder_path: str) -> None:
+def _batches(
+    ctx: ClientContext,
+    items: List[Any],
+    function: Callable[[ClientContext, List[Any]], List[Any]],
+    max_workers: int,
+    executor: ThreadPoolExecutor = None,
+    batch_size: int = 100,
+) -> List[Any]:
+    """
+    Calls function with groups of up to batch_size items, the size of a
+    SharePoint $batch request, and returns the concatenated results.
+    When there are several groups they are sent at the same time with
+    fetch_many.
+    """
+    groups = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    if len(groups) <= 1:
+        return function(ctx, items) if items else []
+    results = fetch_many(
+        ctx,
+        [lambda worker_ctx, group=group: function(worker_ctx, group) for group in groups],
+        max_workers,
+        executor,
+    )
+    return [result for group_results in results for result in group_results]
+
+
+def _expand_folders(
+    ctx: ClientContext, folder_urls: List[str]
+) -> List[Tuple[List[str], List[str]]]:
+    """
+    Returns the server relative urls of the subfolders and the files of
+    every folder of folder_urls, read in a single $batch request.
+    """
+    contents = [
+        get_folder_contents(ctx, ctx.web.get_folder_by_server_relative_url(url), defer=True)
+        for url in folder_urls
+    ]
+    ctx.execute_batch()
+    return [
+        (
+            [folder.serverRelativeUrl for folder in folders],
+            [file.serverRelativeUrl for file in files],
+        )
+        for folders, files in contents
+    ]
+
+
+def _delete_files(ctx: ClientContext, file_urls: List[str]) -> List[str]:
+    for url in file_urls:
+        ctx.web.get_file_by_server_relative_url(url).delete_object()
+    ctx.execute_batch()
+    return file_urls
+
+
+def _delete_folders(ctx: ClientContext, folder_urls: List[str]) -> List[str]:
+    for url in folder_urls:
+        ctx.web.get_folder_by_server_relative_url(url).delete_object()
+    ctx.execute_batch()
+    return folder_urls
+
+
+def delete_folder_with_contents(
+    ctx: ClientContext,
+    folder_path: str,
+    max_workers: int = 8,
+    executor: ThreadPoolExecutor = None,
+) -> None:
     """
     Recursively deletes all files and subfolders in a SharePoint folder,
     and then deletes the folder itself.
 
+    The tree is read one level at a time, expanding the Folders and
+    Files of every folder of the level in $batch requests, and the
+    deletions are then sent in $batch requests as well. When a level or
+    the files need more than one $batch request, those requests are
+    sent at the same time, each from a client context of its own.
+
     Args:
         ctx (ClientContext): SharePoint client context.
         folder_path (str): Server-relative path of the folder to delete.
+        max_workers (int, optional): Maximum number of $batch requests
+        sent at the same time. It has a default value of 8.
+        executor (ThreadPoolExecutor, optional): Thread pool on which
+        the $batch requests are sent, as in fetch_many.
+
+    The folder itself is read and deleted with requests of their own,
+    so a folder that does not exist or can not be deleted raises the
+    ClientRequestException of SharePoint before anything is deleted.
+
+    Raises:
+        ClientRequestException: If the folder itself could not be read
+        or deleted.
+        SharepointBatchErrors: If a file or a subfolder of the tree
+        could not be read or deleted, for example because it is locked.
+        The deletions of the other $batch requests are not undone, so
+        the tree may be left partially deleted.
     """
+    folder_path = join_rel(folder_path)
     folder = ctx.web.get_folder_by_server_relative_url(folder_path)
-    ctx.load(folder)
+    folders, files = get_folder_contents(ctx, folder)
+
+    # Collect the files and subfolders of the tree, level by level
+    file_urls = [file.serverRelativeUrl for file in files]
+    levels = []
+    level = [subfolder.serverRelativeUrl for subfolder in folders]
+    while level:
+        levels.append(level)
+        next_level = []
+        for folder_urls, level_file_urls in _batches(
+            ctx, level, _expand_folders, max_workers, executor
+        ):
+            next_level.extend(folder_urls)
+            file_urls.extend(level_file_urls)
+        level = next_level
+
+    # Delete files, then subfolders from the deepest level, then the folder itself
+    _batches(ctx, file_urls, _delete_files, max_workers, executor)
+    for level in reversed(levels):
+        _batches(ctx, level, _delete_folders, max_workers, executor)
+    folder.delete_object()
     ctx.execute_query()
 
-    # Delete files
-    files = folder.files
-    ctx.load(files)
-    ctx.execute_query()
-    for file in files:
-        file.delete_object()
-    ctx.execute_query()
 
-    # Delete subfolders recursively
-    subfolders = folder.folders
-    ctx.load(subfolders)
-    ctx.execute_query()
-    for subfolder in subfolders:
-        delete_folder_with_contents(ctx, subfolder.properties["ServerRelativeUrl"])
+def fetch_many(
+    ctx: ClientContext,
+    calls: Iterable[Callable[[ClientContext], Any]],
+    max_workers: int = 8,
+    executor: ThreadPoolExecutor = None,
+) -> List[Any]:
+    """
+    The fetch_many function runs independent SharePoint operations at
+    the same time on a thread pool, so the total time is close to the
+    slowest operation instead of the sum of all of them. Every worker
+    thread uses a client context of its own made with clone_context,
+    because a ClientContext can not be shared between threads.
+
+    Example:
+        folders, files = fetch_many(ctx, [
+            lambda c: get_info_folders(c, get_connection_folder(c, "A")),
+            lambda c: get_info_files(c, get_connection_folder(c, "B")),
+        ])
 
-    # Delete the folder itself
-    folder.delete_object()
-    ctx.execute_query()
+    Args:
+        ctx (ClientContext): object representing a client context in a
+         SharePoint environment. A ClientContext typically provides
+         access to SharePoint resources and operations.
+
+        calls (Iterable[Callable[[ClientContext], Any]]): Operations to
+        run, each one receives the client context it must use. Client
+        objects of ctx must not be used inside them.
 
+        max_workers (int, optional): Maximum number of operations
+        running at the same time when executor is not provided, a value
+        of 1 runs them one after the other on the calling thread. It has
+        a default value of 8.
 
+        executor (ThreadPoolExecutor, optional): Thread pool on which
+        the operations run, for example the pool of a
+        SharepointManagement, so concurrent calls share its bounded
+        number of threads. It must not be the pool running the caller,
+        which would wait for operations queued behind itself. A pool of
+        max_workers threads is created for the call when it is not
+        provided.
+
+    Returns:
+        List[Any]: The results of the operations, in the order of calls.
+    """
+    if executor is None and max_workers <= 1:
+        worker_ctx = clone_context(ctx)
+        return [function(worker_ctx) for function in calls]
+    local = threading.local()
+
+    def _call(function: Callable[[ClientContext], Any]) -> Any:
+        worker_ctx = getattr(local, "ctx", None)
+        if worker_ctx is None:
+            worker_ctx = local.ctx = clone_context(ctx)
+        return function(worker_ctx)
+
+    if executor is not None:
+        return list(executor.map(_call, calls))
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sp-io"
+    ) as own_executor:
+        return list(own_executor.map(_call, calls))
@@ -0,0 +1,53 @@
+"""Fake SharePoint transport used by the tests, no request leaves the process."""
+import json
+
+import requests
+
+from sharepoint_manager.sharepoint_functions.functions import PooledClientContext
+
+SITE_URL = "https://tenant.sharepoint.com/sites/site"
+
+
+class FakeAuthentication:
+    def authenticate_request(self, request):
+        pass
+
+
+class FakeDigest:
+    is_valid = True
+    FormDigestValue = "digest"
+
+
+class FakeSession:
+    """Session that answers every request with handler(method, url, options)."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.sent = []
+
+    def request(self, method, url, **options):
+        self.sent.append((method, url))
+        return self.handler(method, url, options)
+
+    def close(self):
+        pass
+
+
+def json_response(payload, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json;odata=verbose"
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def fake_context(handler):
+    """Returns a client context whose requests are answered by handler."""
+    session = FakeSession(handler)
+    ctx = PooledClientContext(SITE_URL, FakeAuthentication(), session)
+    ctx._ctx_web_info = FakeDigest()
+    return ctx, session
+
+
+def pending_queries(ctx):
+    return list(ctx.pending_request()._queries)
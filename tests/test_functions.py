@@ -0,0 +1,156 @@
+import unittest
+
+from office365.runtime.client_request_exception import ClientRequestException
+
+from tests.fakes import fake_context, json_response, pending_queries
+
+from sharepoint_manager.sharepoint_functions.functions import (
+    Information,
+    add_new_item,
+    bulk_update,
+    clear_list_schemas,
+    delete_folder_with_contents,
+    get_connection_list,
+    get_info_list,
+    upload_file_sharepoint,
+)
+
+
+def _unexpected_request(method, url, options):
+    raise AssertionError(f"Unexpected request {method} {url}")
+
+
+class AddNewItemTest(unittest.TestCase):
+    def test_missing_attachment_leaves_no_pending_query(self):
+        ctx, session = fake_context(_unexpected_request)
+        list_sharepoint = get_connection_list(ctx, "Tasks")
+        list_sharepoint.set_property(
+            "ListItemEntityTypeFullName", "SP.Data.TasksListItem", persist_changes=False
+        )
+
+        with self.assertRaises(FileNotFoundError):
+            add_new_item(ctx, list_sharepoint, {"Title": "A"}, "/missing/file.pdf")
+
+        self.assertEqual(pending_queries(ctx), [])
+        self.assertEqual(session.sent, [])
+
+    def test_item_without_attachment_is_created(self):
+        ctx, session = fake_context(
+            lambda method, url, options: json_response({"d": {"Id": 1}})
+        )
+        list_sharepoint = get_connection_list(ctx, "Tasks")
+        list_sharepoint.set_property(
+            "ListItemEntityTypeFullName", "SP.Data.TasksListItem", persist_changes=False
+        )
+
+        add_new_item(ctx, list_sharepoint, {"Title": "A"})
+
+        self.assertEqual(len(session.sent), 1)
+        self.assertTrue(session.sent[0][1].endswith("/items"))
+        self.assertEqual(pending_queries(ctx), [])
+
+
+FIELDS = [
+    {"InternalName": "ID", "TypeAsString": "Counter", "Indexed": False},
+    {"InternalName": "Title", "TypeAsString": "Text", "Indexed": True},
+    {"InternalName": "Status", "TypeAsString": "Choice", "Indexed": False},
+]
+ROWS = [
+    {"Id": 1, "Title": "A", "Status": "Open"},
+    {"Id": 2, "Title": "a", "Status": "Open"},
+    {"Id": 3, "Title": "A", "Status": "Closed"},
+]
+
+
+def _list_handler(method, url, options):
+    if "/fields" in url.lower():
+        return json_response({"d": {"results": FIELDS}})
+    return json_response({"d": {"results": ROWS}})
+
+
+class IndexedFilterTest(unittest.TestCase):
+    def setUp(self):
+        self.ctx, self.session = fake_context(_list_handler)
+        self.list_sharepoint = get_connection_list(self.ctx, "Tasks")
+        self.addCleanup(clear_list_schemas, self.ctx)
+
+    def _items_url(self):
+        return [url for _, url in self.session.sent if "/items" in url][0]
+
+    def test_only_indexed_columns_are_sent_to_sharepoint(self):
+        items = get_info_list(
+            self.ctx,
+            self.list_sharepoint,
+            [Information("Title", "A"), Information("Status", "Open")],
+        )
+
+        fields_url = [url for _, url in self.session.sent if "/fields" in url.lower()][0]
+        self.assertIn("Indexed", fields_url)
+        self.assertIn("$filter=Title eq 'A'", self._items_url())
+        self.assertNotIn("Status eq", self._items_url())
+        self.assertEqual([item.properties["Id"] for item in items], [1])
+
+    def test_filters_without_index_are_applied_in_python(self):
+        items = get_info_list(self.ctx, self.list_sharepoint, [Information("Status", "Open")])
+
+        self.assertNotIn("$filter", self._items_url())
+        self.assertEqual([item.properties["Id"] for item in items], [1, 2])
+
+    def test_bulk_update_uses_the_same_whitelist(self):
+        self.list_sharepoint.set_property(
+            "ListItemEntityTypeFullName", "SP.Data.TasksListItem", persist_changes=False
+        )
+        self.ctx.execute_batch = lambda: None
+
+        updated = bulk_update(
+            self.ctx,
+            self.list_sharepoint,
+            [Information("Status", "Closed")],
+            [Information("Status", "Open")],
+        )
+
+        self.assertNotIn("$filter", self._items_url())
+        self.assertEqual(updated, 1)
+
+
+class UploadFileTest(unittest.TestCase):
+    def test_chunk_size_is_validated_before_any_request(self):
+        ctx, session = fake_context(_unexpected_request)
+
+        with self.assertRaises(ValueError):
+            upload_file_sharepoint(
+                ctx, "Shared Documents", b"data", "file.txt", chunk_size=0
+            )
+
+        self.assertEqual(session.sent, [])
+
+
+class DeleteFolderTest(unittest.TestCase):
+    def test_missing_folder_raises_client_request_exception(self):
+        ctx, session = fake_context(
+            lambda method, url, options: json_response(
+                {"error": {"code": "-2147024894", "message": {"value": "Not found"}}}, 404
+            )
+        )
+
+        with self.assertRaises(ClientRequestException):
+            delete_folder_with_contents(ctx, "/sites/site/Shared Documents/Missing")
+
+        self.assertEqual([method for method, _ in session.sent], ["GET"])
+
+    def test_empty_folder_is_deleted_with_its_own_request(self):
+        def handler(method, url, options):
+            if method == "GET":
+                return json_response({"d": {"Folders": {"results": []}, "Files": {"results": []}}})
+            return json_response({"d": {}})
+
+        ctx, session = fake_context(handler)
+
+        delete_folder_with_contents(ctx, "/sites/site/Shared Documents/Empty")
+
+        self.assertEqual([method for method, _ in session.sent], ["GET", "POST"])
+        self.assertNotIn("$batch", session.sent[1][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
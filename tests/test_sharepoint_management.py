@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+
+from tests.fakes import fake_context
+
+from sharepoint_manager.sharepoint_class_management import sharepoint_management
+from sharepoint_manager.sharepoint_class_management.sharepoint_management import (
+    SharepointManagement,
+)
+
+
+def _unexpected_request(method, url, options):
+    raise AssertionError(f"Unexpected request {method} {url}")
+
+
+def _manager():
+    sharepoint = SharepointManagement(
+        "user", "password", "https://tenant.sharepoint.com/sites/site", "id", "secret"
+    )
+    sharepoint.ctx, _ = fake_context(_unexpected_request)
+    return sharepoint
+
+
+class UserCacheTest(unittest.TestCase):
+    def test_workers_share_the_site_users(self):
+        loads = []
+
+        def get_users_emails(ctx):
+            loads.append(ctx)
+            return {1: "a@tenant.com", 2: "b@tenant.com"}
+
+        with _manager() as sharepoint, mock.patch.object(
+            sharepoint_management, "get_users_emails", get_users_emails
+        ):
+            emails = sharepoint.map("get_email_user", [1, 2, 1, 2] * 4)
+
+        self.assertEqual(emails, ["a@tenant.com", "b@tenant.com"] * 8)
+        self.assertEqual(len(loads), 1)
+
+    def test_refresh_users_reaches_the_workers(self):
+        directory = {1: "old@tenant.com"}
+        loads = []
+
+        def get_users_emails(ctx):
+            loads.append(ctx)
+            return dict(directory)
+
+        with _manager() as sharepoint, mock.patch.object(
+            sharepoint_management, "get_users_emails", get_users_emails
+        ):
+            self.assertEqual(
+                sharepoint.map("get_email_user", [1, 1]), ["old@tenant.com"] * 2
+            )
+            directory[1] = "new@tenant.com"
+            sharepoint.refresh_users()
+            emails = sharepoint.map("get_email_user", [1, 1, 1])
+
+        self.assertEqual(emails, ["new@tenant.com"] * 3)
+        self.assertEqual(len(loads), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()